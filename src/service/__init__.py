@@ -1,7 +1,13 @@
-from .core import Service
-from .settings import ServiceSettings
-from .features.engine import Engine
-from .features.engine_socket import EngineSocketFactory, NngPairSocketFactory
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core import Service
+    from .settings import ServiceSettings
+    from .features.engine import Engine
+    from .features.engine_socket import EngineSocketFactory, NngPairSocketFactory
 
 __all__ = [
     "Service",
@@ -10,3 +16,22 @@ __all__ = [
     "EngineSocketFactory",
     "NngPairSocketFactory",
 ]
+
+# Public names are imported on first access so entry points such as
+# `detectmate-client` don't pay for the whole service stack at start-up.
+_LAZY_EXPORTS = {
+    "Service": ".core",
+    "ServiceSettings": ".settings",
+    "Engine": ".features.engine",
+    "EngineSocketFactory": ".features.engine_socket",
+    "NngPairSocketFactory": ".features.engine_socket",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache for subsequent lookups
+    return value
@@ -3,33 +3,42 @@ import logging
 import sys
 from pathlib import Path
 
-from .settings import ServiceSettings
-from .core import Service
-
 logger = logging.getLogger(__name__)
 
 
+class SplitStreamHandler(logging.Handler):
+    """Write ERROR and above to stderr, everything else to stdout.
+
+    One handler instead of two filtered ones, so each record is
+    formatted and dispatched once.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            stream = sys.stderr if record.levelno >= logging.ERROR else sys.stdout
+            stream.write(self.format(record) + "\n")
+            stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 def setup_logging(level: int = logging.INFO) -> None:
     """Set up logging with errors to stderr and others to stdout."""
-    # create separate handlers for stdout and stderr
-    stdout_handler = logging.StreamHandler(sys.stdout)
-    stdout_handler.setLevel(level)
-    # set filter to allow only non-error messages
-    stdout_handler.addFilter(lambda record: record.levelno < logging.ERROR)
-
-    stderr_handler = logging.StreamHandler(sys.stderr)
-    stderr_handler.setLevel(logging.ERROR)
+    # the format below doesn't use thread/process fields, so skip collecting
+    # them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
-    # common formatter
-    formatter = logging.Formatter('[%(asctime)s] %(levelname)s %(name)s: %(message)s')
-    stdout_handler.setFormatter(formatter)
-    stderr_handler.setFormatter(formatter)
+    handler = SplitStreamHandler(level)
+    handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s %(name)s: %(message)s'))
 
     # configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
-    root_logger.addHandler(stdout_handler)
-    root_logger.addHandler(stderr_handler)
+    root_logger.addHandler(handler)
 
 
 def main() -> None:
@@ -37,13 +46,24 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="DetectMate Service Launcher")
     parser.add_argument("--settings", type=Path, help="Path to service settings YAML")
     parser.add_argument("--config", type=Path, help="Path to component config YAML")
+    parser.add_argument("--settings-json-cache", action="store_true",
+                        help="Keep a parsed copy of the settings next to the YAML as <settings>.yaml.json")
 
     args = parser.parse_args()
 
-    # Load settings
-    if args.settings and args.settings.exists():
-        settings = ServiceSettings.from_yaml(args.settings)
-    else:
+    # imported after argument parsing so --help and usage errors stay fast
+    from .settings import ServiceSettings
+    from .core import Service
+
+    # Load settings; open once instead of checking exists() first
+    settings = None
+    if args.settings:
+        try:
+            with open(args.settings, "rb") as fh:
+                settings = ServiceSettings.from_yaml_fh(fh, json_cache=args.settings_json_cache)
+        except (FileNotFoundError, IsADirectoryError):
+            pass
+    if settings is None:
         logger.error("Settings path must be defined.")
         parser.print_help()
         sys.exit(1)
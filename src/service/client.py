@@ -1,20 +1,83 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import argparse
 import sys
 import json
-import yaml
-import requests
+import shlex
+from functools import lru_cache
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+# requests and yaml are imported where they are used so that `--help` and
+# argument errors don't pay for loading them
+if TYPE_CHECKING:
+    import requests
+
+
+def _dumps_json(obj: Any, pretty: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(obj, indent=2 if pretty else None).encode()
+    # non-str keys: component configs use integer event ids
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+    encoded: bytes = orjson.dumps(obj, option=option)
+    return encoded
+
+
+def _loads_json(data: bytes) -> Any:
+    """Decode UTF-8 JSON, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
 
 
 class DetectMateClient:
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip('/')
         self.timeout: int = 10
+        self._session: requests.Session | None = None
+
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session shared by all calls so the connection is reused."""
+        if self._session is None:
+            import requests
+
+            self._session = requests.Session()
+        return self._session
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> DetectMateClient:
+        return self
+
+    def __exit__(
+            self,
+            _exc_type: type[BaseException] | None,
+            _exc_val: BaseException | None,
+            _exc_tb: TracebackType | None
+    ) -> None:
+        self.close()
 
     def _handle_response(self, response: requests.Response) -> None:
+        import requests
+
         try:
             response.raise_for_status()
-            print(json.dumps(response.json(), indent=2))
+            # peek at the payload instead of attempting a decode on plain-text replies
+            body = response.content.lstrip()
+            if body[:1] in (b"{", b"["):
+                print(_dumps_json(_loads_json(body), pretty=True).decode())
+            else:
+                print(response.text)
         except requests.exceptions.HTTPError as e:
             print(f"Error: {e}")
             if response.text:
@@ -26,20 +89,22 @@ class DetectMateClient:
 
     def start(self) -> None:
         print(f"Sending START to {self.base_url}...")
-        response = requests.post(f"{self.base_url}/admin/start", timeout=self.timeout)
+        response = self.session.post(f"{self.base_url}/admin/start", timeout=self.timeout)
         self._handle_response(response)
 
     def stop(self) -> None:
         print(f"Sending STOP to {self.base_url}...")
-        response = requests.post(f"{self.base_url}/admin/stop", timeout=self.timeout)
+        response = self.session.post(f"{self.base_url}/admin/stop", timeout=self.timeout)
         self._handle_response(response)
 
     def status(self) -> None:
-        response = requests.get(f"{self.base_url}/admin/status", timeout=self.timeout)
+        response = self.session.get(f"{self.base_url}/admin/status", timeout=self.timeout)
         self._handle_response(response)
 
     def metrics(self) -> None:
-        response = requests.get(f"{self.base_url}/metrics", timeout=self.timeout)
+        import requests
+
+        response = self.session.get(f"{self.base_url}/metrics", timeout=self.timeout)
         try:
             response.raise_for_status()
             # Prometheus returns plain text
@@ -49,9 +114,17 @@ class DetectMateClient:
             sys.exit(1)
 
     def reconfigure(self, yaml_file: str, persist: bool) -> None:
+        import yaml
+
+        # Prefer the LibYAML C bindings; fall back to the pure-Python parser.
+        try:
+            from yaml import CSafeLoader as _YamlLoader
+        except ImportError:  # pragma: no cover - PyYAML built without libyaml
+            from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
         try:
             with open(yaml_file, 'r') as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=_YamlLoader)  # nosec B506
 
             payload = {
                 "config": config_data,
@@ -59,9 +132,10 @@ class DetectMateClient:
             }
 
             print(f"Sending RECONFIGURE (persist={persist}) to {self.base_url}...")
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/admin/reconfigure", timeout=self.timeout,
-                json=payload
+                data=_dumps_json(payload),
+                headers={"Content-Type": "application/json"},
             )
             self._handle_response(response)
         except FileNotFoundError:
@@ -70,15 +144,19 @@ class DetectMateClient:
             print(f"Error parsing YAML: {e}")
 
 
-def main() -> None:
+DEFAULT_URL = "http://localhost:8000"
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="detectmate-client",
         description="CLI Client for DetectMateService HTTP Admin API"
     )
     parser.add_argument(
         "--url",
-        default="http://localhost:8000",
-        help="Base URL of the service (default: http://localhost:8000)"
+        default=DEFAULT_URL,
+        help=f"Base URL of the service (default: {DEFAULT_URL})"
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Commands")
@@ -103,9 +181,32 @@ def main() -> None:
         help="Persist changes to the service's config file"
     )
 
+    # Batch
+    batch = subparsers.add_parser(
+        "batch", help="Run commands from a file (one per line) over a single connection"
+    )
+    batch.add_argument("file", help="Path to the command file, e.g. lines like 'status'")
+    return parser
+
+
+def main() -> None:
+    # fast path for the most common scripted call: skip building the parser
+    if sys.argv[1:] == ["status"]:
+        with DetectMateClient(DEFAULT_URL) as client:
+            client.status()
+        return
+
+    parser = _build_parser()
     args = parser.parse_args()
-    client = DetectMateClient(args.url)
+    with DetectMateClient(args.url) as client:
+        if args.command == "batch":
+            _run_batch(parser, client, args.file)
+        else:
+            _run_command(parser, client, args)
+
 
+def _run_command(parser: argparse.ArgumentParser, client: DetectMateClient,
+                 args: argparse.Namespace) -> None:
     if args.command == "start":
         client.start()
     elif args.command == "stop":
@@ -120,5 +221,25 @@ def main() -> None:
         parser.print_help()
 
 
+def _run_batch(parser: argparse.ArgumentParser, client: DetectMateClient, path: str) -> None:
+    """Run each command line from path in order; blank lines and # comments
+    are skipped."""
+    try:
+        with open(path, "r") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        print(f"Error: File '{path}' not found.")
+        sys.exit(1)
+
+    for line in lines:
+        tokens = shlex.split(line, comments=True)
+        if not tokens:
+            continue
+        args = parser.parse_args(tokens)
+        if args.command == "batch":
+            parser.error("batch files cannot contain nested batch commands")
+        _run_command(parser, client, args)
+
+
 if __name__ == "__main__":
     main()
@@ -4,22 +4,25 @@ import sys
 from abc import ABC
 from pathlib import Path
 import threading
+import time
 import json
-from typing import Optional, Type, Literal, Dict, Any, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Type, Literal, Dict, Any, cast
 from types import TracebackType
 
 from pydantic import BaseModel
 
-from service.features.web.server import WebServer
-from service.features.config_manager import ConfigManager
 from service.settings import ServiceSettings
 from service.features.engine import Engine, EngineException
-from service.features.component_loader import ComponentLoader
-from service.features.config_loader import ConfigClassLoader
-from service.features.component_resolver import ComponentResolver
-from detectmatelibrary.common.core import CoreComponent, CoreConfig
 from prometheus_client import REGISTRY, Counter, Enum, Histogram
 
+# the library, the loaders, the config manager and the web server are imported
+# where they are first needed, so services that don't use them skip those imports
+if TYPE_CHECKING:
+    from detectmatelibrary.common.core import CoreComponent, CoreConfig
+    from service.features.config_manager import ConfigManager
+    from service.features.web.server import WebServer
+
 
 engine_running = Enum(
     "engine_running",
@@ -44,10 +47,10 @@ processing_duration_seconds = Histogram(
 
 def get_counter(name: str, documentation: str, labelnames: list[str]) -> Counter:
     """Safely get or create a Prometheus counter."""
-    # Search the registry for an existing collector with this name
-    for collector in REGISTRY._collector_to_names:
-        if name in REGISTRY._collector_to_names[collector]:
-            return collector
+    # Look the name up in the registry's name -> collector index
+    collector = REGISTRY._names_to_collectors.get(name)
+    if collector is not None:
+        return cast(Counter, collector)
     # If not found, create it
     return Counter(name, documentation, labelnames)
 
@@ -61,6 +64,41 @@ data_processed_lines_total = get_counter("data_processed_lines_total",
                                              "component_type", "component_id"])
 
 
+def _dumps_status(obj: Dict[str, Any]) -> str:
+    """Pretty-print a status report as JSON, using orjson when it is
+    installed.
+
+    Values JSON has no type for (dates, sets, binary data from YAML
+    configs) are encoded the way FastAPI's jsonable_encoder does.
+    """
+    from fastapi.encoders import jsonable_encoder
+    try:
+        import orjson
+    except ImportError:
+        try:
+            return json.dumps(obj, indent=2, default=jsonable_encoder)
+        except TypeError:
+            # keys that are neither str nor int/float/bool/None, e.g. dates
+            return json.dumps(jsonable_encoder(obj), indent=2)
+    # non-str keys: component configs use integer event ids
+    encoded: bytes = orjson.dumps(obj, default=jsonable_encoder,
+                                  option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return encoded.decode()
+
+
+# formatters are stateless, so all service loggers share one
+_LOG_FORMATTER = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+
+# default for getattr() probes, cheaper than hasattr()'s AttributeError path
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    """Create a log directory once per process."""
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
 class Service(Engine, ABC):
     """Abstract base for every DetectMate service/component.
 
@@ -68,6 +106,16 @@ class Service(Engine, ABC):
     that Engine calls directly.
     """
 
+    # settings part of the status report, built on first request
+    _settings_dump: Optional[Dict[str, Any]] = None
+    # last status() output as (running, config_manager.version it was built from, JSON)
+    _status_json: Optional[tuple[bool, int, str]] = None
+    # set in __init__ when settings.config_file is given
+    config_manager: Optional[ConfigManager] = None
+    # processed bytes/lines not yet added to the counters (see _flush_metrics)
+    _pending_bytes: int = 0
+    _pending_lines: int = 0
+
     def __init__(
             self,
             settings: ServiceSettings = ServiceSettings(),
@@ -77,47 +125,50 @@ class Service(Engine, ABC):
         self.settings: ServiceSettings = settings
         self.component_id: str = settings.component_id  # type: ignore[assignment]
         self._service_exit_event: threading.Event = threading.Event()
-        self.web_server = None
-        self.web_server = WebServer(self)
+        # built in run(), so services that are never run skip the web stack
+        self.web_server: Optional[WebServer] = None
+
+        # "core" types have no library component to resolve or load
+        # (startswith also covers plain "core")
+        self._is_core: bool = settings.component_type.startswith("core")
 
-        self.log: logging.Logger = self._build_logger()
         # set component_type
-        if hasattr(self, 'component_type'):  # prioritize class attribute over settings
-            pass  # already set by the child class
-        elif (hasattr(settings, "component_type") and
-                settings.component_type not in ("core",) and
-                not settings.component_type.startswith("core")):
+        resolved: Optional[tuple[str, str, str]] = None
+        if getattr(self, 'component_type', _MISSING) is not _MISSING:
+            pass  # already set by the child class (class attribute wins over settings)
+        elif not self._is_core:
+
+            from service.features.component_resolver import ComponentResolver
 
             resolved_type, resolved_config = ComponentResolver.resolve(
                 settings.component_type
             )
-            old_component_type = settings.component_type
+            resolved = (settings.component_type, resolved_type, resolved_config)
             settings.component_type = resolved_type
 
             # Keep self.component_type in sync with the resolved full path
-            if not hasattr(self.__class__, 'component_type'):
-                self.component_type = resolved_type
-
-            # Now build the logger (which uses component_type)
-            self.log = self._build_logger()
-
-            # Log what resolver did
-            if resolved_type != old_component_type:
-                self.log.info(
-                    "Resolved '%s'  →  component: %s  |  config: %s",
-                    old_component_type, resolved_type, resolved_config,
-                )
+            # (we only get here when the class does not define one)
+            self.component_type = resolved_type
 
             if not settings.component_config_class:
                 settings.component_config_class = resolved_config
 
+        # Build the logger once component_type is final (its name uses it)
+        self.log: logging.Logger = self._build_logger()
+
+        # Log what resolver did
+        if resolved is not None and resolved[1] != resolved[0]:
+            self.log.info("Resolved '%s'  →  component: %s  |  config: %s", *resolved)
+
         # Initialize config manager before loading the library component
         # so we can pass the loaded configs to the component
-        self.config_manager: Optional[ConfigManager] = None
+        self.config_manager = None
         loaded_config_dict: Dict[str, Any] = {}
 
-        if hasattr(settings, 'config_file') and settings.config_file:
-            self.log.debug(f"Initializing ConfigManager with file: {settings.config_file}")
+        if settings.config_file:
+            from service.features.config_manager import ConfigManager
+
+            self.log.debug("Initializing ConfigManager with file: %s", settings.config_file)
             self.config_manager = ConfigManager(
                 str(settings.config_file),
                 self.get_config_schema(),
@@ -125,32 +176,49 @@ class Service(Engine, ABC):
             )
             # Get the loaded configs to pass to library component
             configs = self.config_manager.get()
-            self.log.debug(f"Initial configs: {configs}")
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("Initial configs: %s", configs)
             if configs is not None:
-                if hasattr(configs, 'model_dump'):
+                if isinstance(configs, BaseModel):
                     loaded_config_dict = configs.model_dump()
                 elif isinstance(configs, dict):
                     loaded_config_dict = configs
 
         # Load library component if component_type is specified and not core
         self.library_component: Optional[CoreComponent] = None
-        if (hasattr(settings, 'component_type') and
-                settings.component_type != "core" and
-                not settings.component_type.startswith("core")):
+        if not self._is_core:
+
+            from service.features.component_loader import ComponentLoader
 
             try:
-                self.log.info(f"Loading library component: {settings.component_type}")
+                self.log.info("Loading library component: %s", settings.component_type)
                 # use loaded configs from config_manager, fall back to component_config
                 config_to_use = loaded_config_dict or component_config or {}
                 self.library_component = ComponentLoader.load_component(
                     settings.component_type,
                     config_to_use, logger=self.log
                 )
-                self.log.info(f"Successfully loaded component: {self.library_component}")
+                self.log.info("Successfully loaded component: %s", self.library_component)
             except Exception as e:
-                self.log.error(f"Failed to load component {settings.component_type}: {e}")
+                self.log.error("Failed to load component %s: %s", settings.component_type, e)
                 raise
 
+        # intern the identity strings: they end up as keys of the metric
+        # label dicts, where lookups can then short-circuit on identity
+        self.component_type = sys.intern(str(self.component_type))
+        self.component_id = sys.intern(str(self.component_id))
+
+        # bind metric label children once, instead of per message/command
+        labels = {"component_type": self.component_type, "component_id": self.component_id}
+        self._m_bytes: Counter = data_processed_bytes_total.labels(**labels)
+        self._m_lines: Counter = data_processed_lines_total.labels(**labels)
+        self._m_duration: Histogram = processing_duration_seconds.labels(**labels)
+        self._m_starts: Counter = engine_starts_total.labels(**labels)
+        self._m_running: Enum = engine_running.labels(**labels)
+        # time every n-th message only (see metrics_sample_rate)
+        self._sample_every = settings.metrics_sample_rate
+        self._sample_i = 0
+
         # Service IS the processor - Engine will call self.process() directly
         Engine.__init__(self, settings=settings, processor=self, logger=self.log)
         self.log.debug("%s[%s] created and fully initialized", self.component_type, self.component_id)
@@ -161,16 +229,20 @@ class Service(Engine, ABC):
         If component_config_class is specified in settings, load and
         return it. Otherwise, return the default CoreConfig.
         """
-        if hasattr(self.settings, 'component_config_class') and self.settings.component_config_class:
+        if self.settings.component_config_class:
+            from service.features.config_loader import ConfigClassLoader
+
             try:
-                self.log.debug(f"Loading config class: {self.settings.component_config_class}")
+                self.log.debug("Loading config class: %s", self.settings.component_config_class)
                 config_class = ConfigClassLoader.load_config_class(
                     self.settings.component_config_class, logger=self.log)
-                self.log.debug(f"Successfully loaded config class: {config_class}")
+                self.log.debug("Successfully loaded config class: %s", config_class)
                 return config_class
             except Exception as e:
-                self.log.error(f"Failed to load config class {self.settings.component_config_class}: {e}")
+                self.log.error("Failed to load config class %s: %s", self.settings.component_config_class, e)
                 raise
+        from detectmatelibrary.common.core import CoreConfig
+
         return cast(Type[CoreConfig], CoreConfig)  # help mypy
 
     def process(self, raw_message: bytes) -> bytes | None | Any:
@@ -179,31 +251,42 @@ class Service(Engine, ABC):
         This is the main processing method that Engine calls directly.
 
         Tracks metrics and delegates to library component if available,
-        otherwise returns raw message unchanged.
+        otherwise returns raw message unchanged (without timing it).
         """
         if raw_message:
-            data_processed_bytes_total.labels(
-                component_type=self.component_type,
-                component_id=self.component_id
-            ).inc(len(raw_message))
-
             lines = raw_message.count(b'\n') or 1  # at least 1 if message exists
-            data_processed_lines_total.labels(
-                component_type=self.component_type,
-                component_id=self.component_id
-            ).inc(lines)
+            if self._in_batch:
+                # counted locally; the engine loop publishes them after the batch
+                self._pending_bytes += len(raw_message)
+                self._pending_lines += lines
+            else:
+                self._m_bytes.inc(len(raw_message))
+                self._m_lines.inc(lines)
+
+        component = self.library_component
+        if component is None:
+            # Default passthrough behavior for core services without components;
+            # there is no work to time, so skip the histogram
+            return raw_message
+
+        self._sample_i += 1
+        if self._sample_i < self._sample_every:
+            return component.process(raw_message)
+        self._sample_i = 0
 
         # Track processing time
-        with processing_duration_seconds.labels(
-            component_type=self.component_type,
-            component_id=self.component_id
-        ).time():
-            if self.library_component:
-                # Delegate to the library component's process method
-                return self.library_component.process(raw_message)
-            else:
-                # Default passthrough behavior for core services without components
-                return raw_message
+        with self._m_duration.time():
+            # Delegate to the library component's process method
+            return component.process(raw_message)
+
+    def _flush_metrics(self) -> None:
+        """Add the processed bytes/lines counted since the last flush to
+        their Prometheus counters."""
+        if self._pending_bytes:
+            self._m_bytes.inc(self._pending_bytes)
+            self._m_lines.inc(self._pending_lines)
+            self._pending_bytes = 0
+            self._pending_lines = 0
 
     # public API
     def setup_io(self) -> None:
@@ -212,9 +295,13 @@ class Service(Engine, ABC):
 
     def run(self) -> None:
         """Starts the WebServer and waits for the shutdown signal."""
-        # 1. Start Web Server (Admin API)
+        # 1. Start Web Server (Admin API), unless disabled
+        if self.web_server is None and self.settings.http_enabled:
+            from service.features.web.server import WebServer
+
+            self.web_server = WebServer(self)
         if self.web_server:
-            self.log.info(f"HTTP Admin active at {self.settings.http_host}:{self.settings.http_port}")
+            self.log.info("HTTP Admin active at %s:%s", self.settings.http_host, self.settings.http_port)
             self.web_server.start()
 
         # 2. Engine Start logic
@@ -228,49 +315,48 @@ class Service(Engine, ABC):
         # 3. Wait for the global shutdown event
         self._service_exit_event.wait()
 
-        # 4. Final teardown
+        # 4. Final teardown, bounded by shutdown_timeout
+        deadline = time.monotonic() + self.settings.shutdown_timeout
         if self.web_server:
-            self.web_server.stop()
-        if getattr(self, "_running", False):
+            self.web_server.stop()  # only signals uvicorn, joined below
+        if self._running:
             self.stop()  # This calls the Service.stop which calls Engine.stop
         else:
             self.log.debug("Engine already stopped")
+        if self.web_server and self.web_server.is_alive():
+            self.web_server.join(timeout=max(0.0, deadline - time.monotonic()))
+            if self.web_server.is_alive():
+                self.log.warning(
+                    "HTTP Admin did not stop within %.1fs, leaving it behind",
+                    self.settings.shutdown_timeout,
+                )
 
     def start(self) -> str:
         """Expose engine start as a command."""
         # Check if already running to avoid redundant starts
-        if getattr(self, '_running', False):
+        if self._running:
             msg = "Ignored: Engine is already running"
             self.log.debug(msg)
             return msg
 
-        engine_starts_total.labels(
-            component_type=self.component_type,
-            component_id=self.component_id
-        ).inc()
+        self._m_starts.inc()
 
         msg = Engine.start(self)
 
-        engine_running.labels(
-            component_type=self.component_type,
-            component_id=self.component_id
-        ).state('running')
+        self._m_running.state('running')
 
         self.log.info(msg)
         return msg
 
     def stop(self) -> str:
         """Stop both the engine loop and mark the component to exit."""
-        if not getattr(self, "_running", False):
+        if not self._running:
             return "engine already stopped"
 
         self.log.info("Stop command received")
         try:
             Engine.stop(self)
-            engine_running.labels(
-                component_type=self.component_type,
-                component_id=self.component_id
-            ).state('stopped')
+            self._m_running.state('stopped')
             self.log.info("Engine stopped successfully")
             return "engine stopped"
         except EngineException as e:
@@ -279,22 +365,27 @@ class Service(Engine, ABC):
 
     def status(self, cmd: str | None = None) -> str:
         """Comprehensive status report including settings and configs."""
-        if self.config_manager:
-            configs = self.config_manager.get()
-            print(f"DEBUG: Configs from manager: {configs}")
-
-        running = getattr(self, "_running", False)
-
-        # Debug logging
-        self.log.debug(f"Config manager exists: {self.config_manager is not None}")
-        if self.config_manager:
-            configs = self.config_manager.get()
-            self.log.debug(f"Configurations: {configs}")
-            self.log.debug(f"Config file: {self.settings.config_file}")
-
-        # Create status report
-        status_info = self._create_status_report(running)
-        return json.dumps(status_info, indent=2)
+        running = self._running
+        # fetch the configs once and hand them down to the report; the
+        # version is read first, so a concurrent update only causes a rebuild
+        version = self.config_manager.version if self.config_manager else 0
+        configs = self.config_manager.get() if self.config_manager else None
+
+        # Debug logging; configs can be large, so only format them when enabled
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("Config manager exists: %s", self.config_manager is not None)
+            if self.config_manager:
+                self.log.debug("Configurations: %s", configs)
+                self.log.debug("Config file: %s", self.settings.config_file)
+
+        # the JSON is reused while the running flag and the config version
+        # stay the same; only build the report when they changed
+        cached = self._status_json
+        if cached is not None and cached[0] == running and cached[1] == version:
+            return cached[2]
+        text = _dumps_status(self._create_status_report(running, configs))
+        self._status_json = (running, version, text)
+        return text
 
     def reconfigure(self, config_data: Dict[str, Any], persist: bool = False) -> str:
         """Reconfigure service configurations dynamically.
@@ -318,23 +409,9 @@ class Service(Engine, ABC):
             self.config_manager.update(config_data)
 
             if persist:
-                # Get the validated config
-                validated_config = self.config_manager.get()
-                if validated_config is None:
-                    config_dict = {}
-                # Convert to dict using to_dict() to strip defaults and maintain YAML structure
-                elif validated_config and hasattr(validated_config, 'to_dict'):
-                    config_dict = validated_config.to_dict()
-                    self.log.debug(f"Converted config to dict for persistence: {config_dict}")
-                elif isinstance(validated_config, dict):
-                    config_dict = validated_config
-                elif isinstance(validated_config, BaseModel):
-                    config_dict = validated_config.model_dump()
-                else:
-                    config_dict = {}
-
-                # Save to disk
-                self.config_manager.save(config_dict)
+                # Save the validated config to disk; the manager serializes it with
+                # to_dict() to strip defaults, or reuses its cached dict form
+                self.config_manager.save()
                 self.log.info("Persisted configuration to disk")
 
             self.log.info("Reconfigured with: %s", config_data)
@@ -355,7 +432,6 @@ class Service(Engine, ABC):
     def _build_logger(self) -> logging.Logger:
         component_type = getattr(self, 'component_type', 'service')
         component_id = getattr(self, 'component_id', 'unknown')
-        Path(self.settings.log_dir).mkdir(parents=True, exist_ok=True)
         name = f"{component_type}.{component_id}"
         logger = logging.getLogger(name)
         logger.setLevel(getattr(logging, self.settings.log_level.upper(), logging.INFO))
@@ -365,7 +441,7 @@ class Service(Engine, ABC):
         if logger.handlers:
             return logger
 
-        fmt = logging.Formatter("[%(asctime)s] %(levelname)s %(name)s: %(message)s")
+        fmt = _LOG_FORMATTER
 
         # Point the console handler at the real, uncaptured stream & avoid re-adding handlers repeatedly
         if self.settings.log_to_console:
@@ -374,6 +450,7 @@ class Service(Engine, ABC):
             sh.setFormatter(fmt)
             logger.addHandler(sh)
         if self.settings.log_to_file:
+            _ensure_dir(str(self.settings.log_dir))
             fh = logging.FileHandler(
                 Path(self.settings.log_dir) / f"{component_type}_{component_id}.log",
                 encoding="utf-8",
@@ -383,26 +460,24 @@ class Service(Engine, ABC):
             logger.addHandler(fh)
         return logger
 
-    def _create_status_report(self, running: bool) -> Dict[str, Any]:
-        """Create a status report dictionary with settings and configs."""
-        # Convert Path objects in settings to strings for JSON serialization
-        settings_dict = self.settings.model_dump()
-        for key, value in settings_dict.items():
-            if isinstance(value, Path):
-                settings_dict[key] = str(value)
+    def _create_status_report(self, running: bool, configs: Any = _MISSING) -> Dict[str, Any]:
+        """Create a status report dictionary with settings and configs.
+
+        `configs` is the result of config_manager.get() when the caller
+        already fetched it; otherwise it is fetched here.
+        """
+        # settings don't change after __init__, so they are dumped only once
+        if self._settings_dump is None:
+            # JSON mode turns Path values (also nested ones, e.g. TLS files) into strings
+            self._settings_dump = self.settings.model_dump(mode="json")
 
         # Handle configs
         if self.config_manager:
-            configs = self.config_manager.get()
+            if configs is _MISSING:
+                configs = self.config_manager.get()
             if configs is not None:
-                if hasattr(configs, 'model_dump'):
-                    config_dict = configs.model_dump()
-                    # Convert any Path objects in configs to strings
-                    for key, value in config_dict.items():
-                        if isinstance(value, Path):
-                            config_dict[key] = str(value)
-                else:
-                    config_dict = configs
+                # cached by the manager until the next update()
+                config_dict = self.config_manager.get_dump()
             else:
                 config_dict = {}
                 self.log.warning("ConfigManager.get() returned None")
@@ -416,7 +491,7 @@ class Service(Engine, ABC):
                 "component_id": self.component_id,
                 "running": running
             },
-            "settings": settings_dict,
+            "settings": self._settings_dump,
             "configs": config_dict
         }
 
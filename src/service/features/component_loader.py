@@ -1,15 +1,68 @@
 import importlib
-from typing import Any, Dict
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any, Dict, Optional, Tuple
 import logging
 
 from detectmatelibrary.common.core import CoreComponent
 
 
+def cached_import(module_name: str) -> ModuleType:
+    """Return an already imported module straight from sys.modules, and
+    only go through importlib (and its import lock) otherwise.
+
+    Modules that are still initializing are imported normally, so a
+    partially executed module is never handed out.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        spec = getattr(module, "__spec__", None)
+        if spec is not None and getattr(spec, "_initializing", False) is False:
+            return module
+    return importlib.import_module(module_name)
+
+
+def module_available(module_name: str) -> bool:
+    """Tell whether `module_name` is importable without importing it.
+
+    Loaded modules are answered from sys.modules; otherwise the import
+    system's finders are asked for a spec, which is much cheaper than a
+    failing import_module().
+    """
+    if module_name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        # missing parent package, or a parent without __path__ / __spec__
+        return False
+
+
+def lookup_class(cache: Dict[Any, Tuple[ModuleType, type]], key: Any) -> Optional[type]:
+    """Return a class remembered in `cache`, as long as the module it came
+    from is still the one registered in sys.modules.
+
+    Entries whose module was replaced or removed are ignored, so the caller
+    falls back to a normal import.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    module, klasse = entry
+    if sys.modules.get(module.__name__) is not module:
+        return None
+    return klasse
+
+
 class ComponentLoader:
     """Loads components dynamically, with DetectMate-relative fallback."""
 
     DEFAULT_ROOT = "detectmatelibrary"
 
+    # (DEFAULT_ROOT, component_type) -> (module, component class)
+    _class_cache: Dict[Tuple[str, str], Tuple[ModuleType, type]] = {}
+
     @classmethod
     def load_component(cls,
                        component_type: str, config: Dict[str, Any] | None = None,
@@ -30,19 +83,22 @@ class ComponentLoader:
                 )
 
             module_name, class_name = component_type.rsplit('.', 1)
-            log.debug("Importing module %r, class %r", module_name, class_name)
-            # Try as-is first, then fall back to detectmatelibrary-relative
-            try:
-                module = importlib.import_module(module_name)
-            except ImportError:
-                full_module = f"{cls.DEFAULT_ROOT}.{module_name}"
-                log.debug("Direct import failed, retrying as %r", full_module)
-                try:
-                    module = importlib.import_module(full_module)
-                except ImportError:
-                    raise ImportError(f"Could not import '{module_name}' or '{full_module}'")
-
-            component_class = getattr(module, class_name)
+            cache_key = (cls.DEFAULT_ROOT, component_type)
+            component_class = lookup_class(cls._class_cache, cache_key)
+            if component_class is None:
+                log.debug("Importing module %r, class %r", module_name, class_name)
+                # Try as-is first, then fall back to detectmatelibrary-relative
+                if module_available(module_name):
+                    module = cached_import(module_name)
+                else:
+                    full_module = f"{cls.DEFAULT_ROOT}.{module_name}"
+                    log.debug("Module %r not found, trying %r", module_name, full_module)
+                    if not module_available(full_module):
+                        raise ImportError(f"Could not import '{module_name}' or '{full_module}'")
+                    module = cached_import(full_module)
+
+                component_class = getattr(module, class_name)
+                cls._class_cache[cache_key] = (module, component_class)
 
             if config:
                 instance = component_class(config=config)
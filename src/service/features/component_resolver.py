@@ -1,12 +1,13 @@
 # service/features/component_resolver.py
 from __future__ import annotations
 
-import importlib
+import functools
 import inspect
 import pkgutil
 from typing import Optional, Tuple
 
 from detectmatelibrary.common.core import CoreComponent
+from service.features.component_loader import cached_import
 
 _LIBRARY_ROOT = "detectmatelibrary"
 
@@ -17,16 +18,22 @@ class ComponentResolver:
 
     Already fully-qualified paths (with a dot) are returned as-is and we try to
     get the config class from the same module.
-    For Short names wewalk the sub-modules of `detectmatelibrary` and find
-    a class whose __name__ matches.
+    For Short names we walk `detectmatelibrary` and take the first public
+    module exporting the class (e.g. the package re-exporting it rather than
+    its defining module).
 
     Example:
     Given class FooDetector in module detectmatelibrary.detectors.foo,
     the resolver looks for FooDetectorConfig in the same module (!).
     Fall back to CoreConfig if nothing is found.
+
+    The library layout does not change while a service is running, so the
+    lookups are memoized; use ``ComponentResolver.resolve.cache_clear()`` to
+    reset them (e.g. in tests).
     """
 
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def resolve(
         cls,
         component_type: str,
@@ -57,18 +64,39 @@ class ComponentResolver:
         config_path = cls._find_config_in_module(module_path, class_name)
         return full_component_path, config_path
 
+    @staticmethod
+    def _is_public(module_name: str) -> bool:
+        return not any(part.startswith("_") for part in module_name.split("."))
+
+    @staticmethod
+    def _component_in(module_name: str, class_name: str) -> bool:
+        """Tell whether `module_name` exports a CoreComponent subclass named
+        `class_name`."""
+        try:
+            module = cached_import(module_name)
+        except Exception:
+            return False
+        klasse = getattr(module, class_name, None)
+        return (inspect.isclass(klasse) and issubclass(klasse, CoreComponent) and
+                klasse is not CoreComponent)
+
     @classmethod
     def _search_for_class(
         cls, class_name: str
     ) -> Optional[Tuple[str, str, str]]:
-        """Search detectmatelibrary and return the first module that exports a
-        CoreComponent subclass with the given name.
+        """Return the first public module under detectmatelibrary, in
+        pkgutil.walk_packages order, that exports a CoreComponent subclass
+        with the given name.
+
+        Packages come before their contents, so a class is reported under
+        the package that re-exports it; modules with a `_`-prefixed part
+        are never returned.
 
         Returns (dotted_component_path, dotted_module_path, class_name)
         or None.
         """
         try:
-            root_pkg = importlib.import_module(_LIBRARY_ROOT)
+            root_pkg = cached_import(_LIBRARY_ROOT)
         except ImportError:
             return None
 
@@ -77,24 +105,13 @@ class ComponentResolver:
             prefix=f"{_LIBRARY_ROOT}.",
             onerror=lambda _: None,
         ):
-            try:
-                module = importlib.import_module(module_name)
-            except Exception:  # nosec B112
-                continue
-
-            klasse = getattr(module, class_name, None)
-            if klasse is None:
-                continue
-            if not (inspect.isclass(klasse) and issubclass(klasse, CoreComponent) and
-                    klasse is not CoreComponent):
-                continue
-
-            # Found it:
-            return f"{module_name}.{class_name}", module_name, class_name
+            if cls._is_public(module_name) and cls._component_in(module_name, class_name):
+                return f"{module_name}.{class_name}", module_name, class_name
 
         return None
 
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def _find_config_in_module(cls, module_path: str, class_name: str) -> str:
         """Look for <ClassName>Config in the same module.
 
@@ -112,7 +129,7 @@ class ComponentResolver:
 
         for candidate_path in candidates:
             try:
-                module = importlib.import_module(candidate_path)
+                module = cached_import(candidate_path)
             except ImportError:
                 continue
 
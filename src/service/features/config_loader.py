@@ -1,8 +1,9 @@
-import importlib
 import logging
-from typing import Type, cast
+from types import ModuleType
+from typing import Dict, Tuple, Type, cast
 
 from detectmatelibrary.common.core import CoreConfig
+from service.features.component_loader import cached_import, lookup_class
 
 log = logging.getLogger(__name__)
 
@@ -13,6 +14,9 @@ class ConfigClassLoader:
 
     BASE_PACKAGE = "detectmatelibrary"
 
+    # (BASE_PACKAGE, config_class_path) -> (module, config class)
+    _class_cache: Dict[Tuple[str, str], Tuple[ModuleType, type]] = {}
+
     @classmethod
     def load_config_class(cls,
                           config_class_path: str,
@@ -33,6 +37,11 @@ class ConfigClassLoader:
             RuntimeError: For other failures (e.g. invalid format)
         """
         log = logger or logging.getLogger(__name__)
+        cache_key = (cls.BASE_PACKAGE, config_class_path)
+        cached = lookup_class(cls._class_cache, cache_key)
+        if cached is not None:
+            return cast(Type[CoreConfig], cached)
+
         log.debug("Loading config class: %r", config_class_path)
         try:
             # handle "module.ClassName" formats
@@ -49,17 +58,17 @@ class ConfigClassLoader:
             if module_name.startswith(f"{cls.BASE_PACKAGE}.") or module_name == cls.BASE_PACKAGE:
                 log.debug("Path is already fully qualified, importing directly")
                 try:
-                    module = importlib.import_module(module_name)
+                    module = cached_import(module_name)
                 except ImportError as e:
                     raise ImportError(f"Failed to import config class {config_class_path}: {e}") from e
             else:
                 prefixed = f"{cls.BASE_PACKAGE}.{module_name}"
                 try:
-                    module = importlib.import_module(prefixed)
+                    module = cached_import(prefixed)
                     log.debug("Imported via library-relative path: %r", prefixed)
                 except ImportError:
                     log.debug("Library-relative import failed, falling back to absolute: %r", module_name)
-                    module = importlib.import_module(module_name)  # absolute fallback
+                    module = cached_import(module_name)  # absolute fallback
                     log.debug("Imported via absolute path: %r", module_name)
 
             # get the class
@@ -68,6 +77,7 @@ class ConfigClassLoader:
             if not issubclass(config_class, CoreConfig):
                 raise TypeError(f"Config class {class_name} must inherit from CoreConfig")
 
+            cls._class_cache[cache_key] = (module, config_class)
             return cast(Type[CoreConfig], config_class)
 
         except ImportError as e:
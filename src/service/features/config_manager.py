@@ -1,13 +1,43 @@
 import os
+import stat
 import yaml
 import threading
 import logging
 from pathlib import Path
-from typing import Type, Optional, Dict, Any, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
 from pydantic import BaseModel, ValidationError
 
 from detectmatelibrary.common.core import CoreConfig
 
+# Prefer the LibYAML C bindings; fall back to the pure-Python parser/emitter.
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper  # type: ignore[assignment]
+
+
+def _dump_yaml(data: Any) -> bytes:
+    """Render a config document the way save() writes it, as UTF-8."""
+    encoded: bytes = yaml.dump(data, Dumper=_YamlDumper, default_flow_style=False,
+                               sort_keys=False, encoding="utf-8")
+    return encoded
+
+
+def _load_document(raw: bytes) -> Any:
+    """Parse a config document. JSON is also valid YAML; such files are
+    parsed with orjson when it is installed."""
+    if raw.lstrip()[:1] in (b"{", b"["):
+        try:
+            import orjson
+        except ImportError:
+            pass
+        else:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # YAML flow style rather than JSON
+    return yaml.load(raw, Loader=_YamlLoader)  # nosec B506
+
 
 class ServiceConfig(BaseModel):
     detectors: Optional[Dict[str, Dict[str, Any]]] = None
@@ -25,6 +55,12 @@ class ConfigManager:
         self.config_file = config_file
         self.schema = schema
         self._configs: Optional[Union[CoreConfig, Dict[str, Any]]] = None
+        self._dump: Optional[Dict[str, Any]] = None  # dict form of _configs, built on demand
+        self._serialize: Callable[[], Dict[str, Any]] = dict  # what save() writes for _configs
+        # (st_mtime_ns, st_size) of the file behind _configs; None forces a re-read
+        self._last_stat: Optional[Tuple[int, int]] = None
+        # bumped on every update/save, so callers can key caches on it
+        self.version = 0
         self._lock = threading.RLock()
         self.logger = logger or logging.getLogger(__name__)
 
@@ -32,23 +68,40 @@ class ConfigManager:
         self.load()
 
     def load(self) -> None:
-        """Load parameters from file."""
-        self.logger.debug(f"Loading parameters from {self.config_file}")
-        if not os.path.exists(self.config_file):
-            self.logger.info(f"Parameter file {self.config_file} doesn't exist, creating default")
+        """Load parameters from file.
+
+        Does nothing if the file is unchanged (same mtime and size) since
+        the last successful load.
+        """
+        with self._lock:
+            self._load()
+
+    def _load(self) -> None:
+        self.logger.debug("Loading parameters from %s", self.config_file)
+        try:
+            f = open(self.config_file, 'rb')
+        except FileNotFoundError:
+            self.logger.info("Parameter file %s doesn't exist, creating default", self.config_file)
             # Create default parameters if file doesn't exist
             if self.schema:
-                self._configs = self.schema()
-                self.logger.debug(f"Created default params: {self._configs}")
+                self._set_configs(self.schema())
+                self.logger.debug("Created default params: %s", self._configs)
                 self.save()
             else:
                 self.logger.warning("No schema provided, cannot create default parameters")
             return
 
         try:
-            with open(self.config_file, 'r') as f:
-                data = yaml.safe_load(f)
-            self.logger.debug(f"Loaded data from file: {data}")
+            with f:
+                # stat the open file, so the key describes exactly what is read
+                st = os.fstat(f.fileno())
+                stat_key = (st.st_mtime_ns, st.st_size)
+                if stat_key == self._last_stat:
+                    self.logger.debug("Parameter file %s unchanged, keeping loaded params", self.config_file)
+                    return
+                raw = f.read()
+            data = _load_document(raw)
+            self.logger.debug("Loaded data from file: %s", data)
 
             if self.schema and data:
                 # Problem: mismatch between component config schema and structure the library expects
@@ -57,74 +110,133 @@ class ConfigManager:
                 # expects cannot nest, because self.schema does not accept a params field, which the library
                 # expects --> validate against ServiceConfig here, let library handle the rest
 
-                self._configs = ServiceConfig.model_validate(data)
-                self.logger.debug(f"Validated params: {self._configs}")
+                self._set_configs(ServiceConfig.model_validate(data))
+                self.logger.debug("Validated params: %s", self._configs)
             elif data:
                 # If no schema, store as raw dict
-                self._configs = data
-                self.logger.debug(f"Stored raw data: {self._configs}")
+                self._set_configs(data)
+                self.logger.debug("Stored raw data: %s", self._configs)
+            self._last_stat = stat_key
 
         except (yaml.YAMLError, ValidationError) as e:
-            self.logger.error(f"Failed to load parameters from {self.config_file}: {e}")
+            self.logger.error("Failed to load parameters from %s: %s", self.config_file, e)
             raise
 
+    def _set_configs(self, configs: Union[CoreConfig, Dict[str, Any]]) -> None:
+        """Publish new configs together with the serializer save() uses for
+        them; callers hold the lock."""
+        if isinstance(configs, BaseModel):
+            # Prefer to_dict() to avoid defaults; otherwise write the cached
+            # dict form, which status reports share
+            to_dict = getattr(configs, "to_dict", None)
+            self._serialize = to_dict if to_dict is not None else self.get_dump
+        else:
+            # Already a dict
+            self._serialize = lambda: configs
+        self._dump = None
+        self._configs = configs
+        self.version += 1
+
     def save(self, config_dict: Optional[Dict[str, Any]] = None) -> None:
         """Save component configs to file.
 
         Args:
             config_dict: Optional dict to save directly. If None, serializes
                         current config model using to_dict() if available,
-                        otherwise model_dump().
+                        otherwise the get_dump() dict.
         """
         with self._lock:
+            self._last_stat = None  # the file no longer matches what was loaded
+            # the configs may have been changed in place since the last dump
+            self._dump = None
+            self.version += 1
             if config_dict is not None:
                 data = config_dict
                 self.logger.debug("Saving provided config dict")
             elif self._configs is None:
                 return
-            elif isinstance(self._configs, BaseModel):
-                # Prefer to_dict() over model_dump() to avoid defaults
-                if hasattr(self._configs, 'to_dict'):
-                    data = self._configs.to_dict()
-                    self.logger.debug("Using to_dict() for serialization")
-                else:
-                    data = self._configs.model_dump()
-                    self.logger.debug("Using model_dump() for serialization")
             else:
-                # Already a dict
-                data = self._configs
+                data = self._serialize()
 
             param_dir = Path(self.config_file).parent
             try:
                 param_dir.mkdir(parents=True, exist_ok=True)
             except PermissionError:
-                self.logger.error(f"Permission denied creating directory {param_dir}")
+                self.logger.error("Permission denied creating directory %s", param_dir)
                 raise
             except OSError as e:
-                self.logger.error(f"Failed to create directory {param_dir}: {e}")
+                self.logger.error("Failed to create directory %s: %s", param_dir, e)
                 raise
 
+            # write a sibling file and swap it in, so readers (and a crash
+            # mid-write) never see a partially written config
+            tmp_file = f"{self.config_file}.tmp"
+            try:
+                # serialise first, so a dump error never creates the temp file,
+                # then write the whole document at once
+                encoded = _dump_yaml(data)
+                with open(tmp_file, 'wb') as f:
+                    f.write(encoded)
+                    f.flush()
+                    os.fsync(f.fileno())
+                try:
+                    # keep the permissions of the file being replaced
+                    os.chmod(tmp_file, stat.S_IMODE(os.stat(self.config_file).st_mode))
+                except FileNotFoundError:
+                    pass
+                os.replace(tmp_file, self.config_file)
+                self.logger.debug("Parameters saved to %s", self.config_file)
+            except PermissionError:
+                self.logger.error("Permission denied writing to file %s", self.config_file)
+                self._discard(tmp_file)
+                raise
+            except Exception as e:
+                self.logger.error("Failed to save parameters to %s: %s", self.config_file, e)
+                self._discard(tmp_file)
+                raise
+
+    @staticmethod
+    def _discard(path: str) -> None:
+        """Remove a leftover temporary file, if there is one."""
         try:
-            with open(self.config_file, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False, sort_keys=False)
-            self.logger.debug(f"Parameters saved to {self.config_file}")
-        except PermissionError:
-            self.logger.error(f"Permission denied writing to file {self.config_file}")
-            raise
-        except Exception as e:
-            self.logger.error(f"Failed to save parameters to {self.config_file}: {e}")
-            raise
+            os.remove(path)
+        except OSError:
+            pass
 
     def update(self, new_configs: Dict[str, Any]) -> None:
         """Update parameters with validation."""
         with self._lock:
             if self.schema:
-                self._configs = ServiceConfig.model_validate(new_configs)
+                self._set_configs(ServiceConfig.model_validate(new_configs))
             else:
-                self._configs = new_configs
-            self.logger.info(f"Parameters updated: {self._configs}")
+                self._set_configs(new_configs)
+            self._last_stat = None
+            self.logger.info("Parameters updated: %s", self._configs)
 
     def get(self) -> Optional[Union[CoreConfig, Dict[str, Any]]]:
-        """Get current parameters."""
+        """Get current parameters.
+
+        Lock-free: writers build the new configs completely and publish
+        them with a single attribute assignment.
+        """
+        return self._configs
+
+    def get_dump(self) -> Dict[str, Any]:
+        """Get current parameters as a dict, with Path values as strings.
+
+        The dict is built once per load/update/save and shared between
+        callers, so treat it as read-only.
+        """
         with self._lock:
-            return self._configs
+            if self._dump is None:
+                if isinstance(self._configs, BaseModel):
+                    dump = self._configs.model_dump()
+                    for key, value in dump.items():
+                        if isinstance(value, Path):
+                            dump[key] = str(value)
+                elif isinstance(self._configs, dict):
+                    dump = self._configs
+                else:
+                    dump = {}
+                self._dump = dump
+            return self._dump
@@ -54,6 +54,27 @@ processing_errors_total = Counter(
 )
 
 
+_FRAME_HEADER = 4  # big-endian payload length in front of each coalesced message
+
+
+def unpack_frames(data: bytes) -> List[bytes]:
+    """Split a message sent with engine_max_batch_bytes > 0 back into the
+    individual outputs it carries."""
+    frames: List[bytes] = []
+    pos = 0
+    end = len(data)
+    while pos < end:
+        if end - pos < _FRAME_HEADER:
+            raise ValueError("Truncated frame header in coalesced message")
+        size = int.from_bytes(data[pos:pos + _FRAME_HEADER], "big")
+        pos += _FRAME_HEADER
+        if end - pos < size:
+            raise ValueError("Truncated frame payload in coalesced message")
+        frames.append(data[pos:pos + size])
+        pos += size
+    return frames
+
+
 class EngineException(Exception):
     """Custom exception for engine-related errors."""
 
@@ -65,8 +86,12 @@ class Processor(Protocol):
     is typically a Service instance.
     """
 
-    def process(self, raw_message: bytes) -> bytes | None:
-        """Process a raw message and return the result or None."""
+    def process(self, raw_message: bytes) -> bytes | bytearray | memoryview | None:
+        """Process a raw message and return the result or None.
+
+        Any bytes-like result is accepted; pynng only sends ``bytes``,
+        so other buffers are converted once before sending.
+        """
         ...
 
 
@@ -81,6 +106,10 @@ class Engine(ABC):
     Typically this is a Service instance that delegates to library components.
     """
 
+    # class-level defaults so the flags read False before __init__ has run
+    _running: bool = False
+    _in_batch: bool = False  # set while the loop runs process_batch()
+
     def __init__(
             self,
             settings: Optional[ServiceSettings] = None,
@@ -99,12 +128,11 @@ class Engine(ABC):
         self.processor = processor
         self._stop_event = threading.Event()
         self.log = logger or logging.getLogger(__name__)
+        self._bind_metrics()
 
-        # control flags
+        # control flags; the loop thread is created on start()
         self._running = False
-        self._thread = threading.Thread(
-            target=self._run_loop, name="EngineLoop", daemon=True
-        )
+        self._thread: Optional[threading.Thread] = None
 
         # set up the engine socket via the factory abstraction
         addr = str(self.settings.engine_addr)
@@ -130,6 +158,21 @@ class Engine(ABC):
 
         self.log.debug("Engine initialized and ready.")
 
+    def _bind_metrics(self) -> None:
+        """Resolve the labelled metric children once, so the loop does not
+        go through .labels() for every message."""
+        labels = {
+            "component_type": getattr(self, "component_type", "core"),
+            "component_id": self.settings.component_id
+        }
+        self._m_read_bytes = data_read_bytes_total.labels(**labels)
+        self._m_read_lines = data_read_lines_total.labels(**labels)
+        self._m_written_bytes = data_written_bytes_total.labels(**labels)
+        self._m_written_lines = data_written_lines_total.labels(**labels)
+        self._m_dropped_bytes = data_dropped_bytes_total.labels(**labels)
+        self._m_dropped_lines = data_dropped_lines_total.labels(**labels)
+        self._m_errors = processing_errors_total.labels(**labels)
+
     def _setup_output_sockets(self) -> None:
         """Create and connect output sockets for all destinations in out_addr.
 
@@ -172,47 +215,32 @@ class Engine(ABC):
                 # Non-blocking dial: returns immediately, connects in background
                 sock.dial(addr_str, block=False)
                 self._out_sockets.append(sock)
-                self.log.info(f"Initialized output socket for {addr_str} (background connect)")
+                self.log.info("Initialized output socket for %s (background connect)", addr_str)
             except Exception as e:
                 # This catches invalid URLs or other immediate setup errors
-                self.log.error(f"Failed to initialize output socket for {addr_str}: {e}")
+                self.log.error("Failed to initialize output socket for %s: %s", addr_str, e)
                 # We attempt to continue with other sockets rather than crashing entirely
 
     def start(self) -> str:
         if not self._running:
             self._running = True
             self._stop_event.clear()
-            # RECREATE THE THREAD if it's dead or doesn't exist
-            if not self._thread.is_alive():
-                self._thread = threading.Thread(
-                    target=self._run_loop,
-                    name="EngineLoop",
-                    daemon=True
-                )
+            # threads can't be restarted, so every start gets a fresh loop thread
+            self._thread = threading.Thread(
+                target=self._run_loop,
+                name="EngineLoop",
+                daemon=True
+            )
             self._thread.start()
             return "engine started"
         return "engine already running"
 
     def _run_loop(self) -> None:
-        labels = {
-            "component_type": getattr(self, "component_type", "core"),
-            "component_id": self.settings.component_id
-        }
-
         while self._running and not self._stop_event.is_set():
 
-            # recv phase
+            # recv phase: block for the first message, then drain what is queued
             try:
                 raw = self._pair_sock.recv()
-                if raw is None or len(raw) == 0:
-                    self.log.debug("Engine: Received empty message, skipping")
-                    continue
-
-                # TRACK read bytes and lines
-                data_read_bytes_total.labels(**labels).inc(len(raw))
-                data_read_lines_total.labels(**labels).inc(raw.count(b'\n') or 1)
-
-                self.log.debug(f"Engine: Received {len(raw)} bytes from socket")
             except pynng.Timeout:
                 continue  # Timeout occurred, check running flag and continue
             except pynng.NNGException as e:
@@ -225,79 +253,200 @@ class Engine(ABC):
                 self.log.exception("Unexpected engine error during receive: %s", e)
                 continue
 
+            batch = self._drain_batch(raw)
+            if not batch:
+                self.log.debug("Engine: Received empty message, skipping")
+                continue
+
+            # TRACK read bytes and lines, one counter update per batch
+            self._m_read_bytes.inc(sum(len(raw) for raw in batch))
+            self._m_read_lines.inc(sum(raw.count(b'\n') or 1 for raw in batch))
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("Engine: Received %d message(s) from socket", len(batch))
+
             # process phase
+            self._in_batch = True
             try:
-                self.log.debug("Engine: Calling processor.process()...")
-                out = self.processor.process(raw)
-                self.log.debug(f"Engine: Processor returned: {out!r}")
+                outputs = self.process_batch(batch)
             except Exception as e:
-                processing_errors_total.labels(**labels).inc()
+                self._m_errors.inc(len(batch))
                 self.log.exception("Engine error during process: %s", e)
                 continue
-
-            if out is None:
-                self.log.debug("Engine: Processor returned None, skipping send")
-                continue
+            finally:
+                self._in_batch = False
+                self._flush_metrics()
 
             # send phase
-            if self._out_sockets:
-                # Multi-destination mode: send to all configured outputs
-                if self._send_to_outputs(out):
-                    data_written_bytes_total.labels(**labels).inc(len(out))
-                    data_written_lines_total.labels(**labels).inc(out.count(b'\n') or 1)
-            else:
-                # Backwards-compatible mode: no outputs configured, reply on PAIR socket
-                try:
-                    self.log.debug(
-                        "Engine: No output sockets configured, "
-                        "sending reply back via engine socket"
-                    )
-                    self._pair_sock.send(out)
-                    # TRACK written bytes and lines (Fallback mode)
-                    data_written_bytes_total.labels(**labels).inc(len(out))
-                    data_written_lines_total.labels(**labels).inc(out.count(b'\n') or 1)
-                    self.log.debug("Engine: Reply sent on engine socket")
-                except pynng.NNGException as e:
-                    data_dropped_bytes_total.labels(**labels).inc(len(out))
-                    data_dropped_lines_total.labels(**labels).inc(out.count(b'\n') or 1)
-                    self.log.error("Engine error sending reply on engine socket: %s", e)
+            payloads: List[bytes] = []
+            for out in outputs:
+                if out is None:
+                    if self.log.isEnabledFor(logging.DEBUG):
+                        self.log.debug("Engine: Processor returned None, skipping send")
                     continue
+                payloads.append(out)
+            if self._out_sockets and self.settings.engine_max_batch_bytes > 0:
+                self._emit_coalesced(payloads)
+            else:
+                for out in payloads:
+                    self._emit(out)
+
+    def _flush_metrics(self) -> None:
+        """Hook run by the loop after every processed batch.
 
-    def _send_to_outputs(self, data: bytes) -> bool:
+        Subclasses that accumulate metrics per message while _in_batch is
+        set publish them here; the default does nothing.
+        """
+
+    def _drain_batch(self, first: bytes | None) -> List[bytes]:
+        """Collect `first` plus any messages already queued on the engine
+        socket, up to engine_batch_size or engine_batch_ms.
+
+        Empty messages are dropped.
+        """
+        batch = [first] if first else []
+        limit = self.settings.engine_batch_size
+        if limit <= 1:
+            return batch
+        deadline = time.monotonic() + self.settings.engine_batch_ms / 1000
+        while len(batch) < limit and time.monotonic() < deadline:
+            try:
+                raw = self._pair_sock.recv(block=False)
+            except pynng.TryAgain:
+                break  # nothing queued right now
+            except pynng.NNGException:
+                break  # let the blocking recv() surface the error
+            if raw:
+                batch.append(raw)
+        return batch
+
+    def process_batch(self, raw_messages: List[bytes]) -> List[bytes | None]:
+        """Process a batch of raw messages, returning one output per input.
+
+        The default calls processor.process() per message; a failing
+        message yields None and does not affect the rest of the batch.
+        Subclasses may override this to process the batch at once.
+        """
+        debug = self.log.isEnabledFor(logging.DEBUG)
+        process = self.processor.process  # bound once per batch
+        outputs: List[bytes | None] = []
+        for raw in raw_messages:
+            try:
+                if debug:
+                    self.log.debug("Engine: Calling processor.process()...")
+                result = process(raw)
+                if debug:
+                    self.log.debug("Engine: Processor returned: %r", result)
+                if isinstance(result, (bytearray, memoryview)):
+                    result = bytes(result)
+                elif result is not None and not isinstance(result, bytes):
+                    self._m_errors.inc()
+                    self.log.error("Engine: processor returned %s, expected bytes", type(result).__name__)
+                    result = None
+            except Exception as e:
+                self._m_errors.inc()
+                self.log.exception("Engine error during process: %s", e)
+                result = None
+            outputs.append(result)
+        return outputs
+
+    def _emit(self, out: bytes) -> None:
+        """Forward one processed message to the outputs, or reply on the
+        engine socket when no outputs are configured."""
+        if self._out_sockets:
+            # Multi-destination mode: send to all configured outputs
+            if self._send_to_outputs(out):
+                self._m_written_bytes.inc(len(out))
+                self._m_written_lines.inc(out.count(b'\n') or 1)
+            return
+
+        # Backwards-compatible mode: no outputs configured, reply on PAIR socket
+        debug = self.log.isEnabledFor(logging.DEBUG)
+        try:
+            if debug:
+                self.log.debug(
+                    "Engine: No output sockets configured, "
+                    "sending reply back via engine socket"
+                )
+            self._pair_sock.send(out)
+            # TRACK written bytes and lines (Fallback mode)
+            self._m_written_bytes.inc(len(out))
+            self._m_written_lines.inc(out.count(b'\n') or 1)
+            if debug:
+                self.log.debug("Engine: Reply sent on engine socket")
+        except pynng.NNGException as e:
+            self._m_dropped_bytes.inc(len(out))
+            self._m_dropped_lines.inc(out.count(b'\n') or 1)
+            self.log.error("Engine error sending reply on engine socket: %s", e)
+
+    def _emit_coalesced(self, payloads: List[bytes]) -> None:
+        """Forward a batch of outputs as length-prefixed frames, each send
+        carrying at most engine_max_batch_bytes (a single larger output is
+        sent in a frame of its own)."""
+        limit = self.settings.engine_max_batch_bytes
+        frame = bytearray()
+        members: List[bytes] = []
+        for out in payloads:
+            if members and len(frame) + _FRAME_HEADER + len(out) > limit:
+                self._flush_frame(frame, members)
+                frame = bytearray()
+                members = []
+            frame += len(out).to_bytes(_FRAME_HEADER, "big")
+            frame += out
+            members.append(out)
+        if members:
+            self._flush_frame(frame, members)
+
+    def _flush_frame(self, frame: bytearray, members: List[bytes]) -> None:
+        lines = sum(out.count(b'\n') or 1 for out in members)
+        size = len(frame) - _FRAME_HEADER * len(members)
+        if self._send_to_outputs(bytes(frame), lines=lines, size=size):
+            self._m_written_bytes.inc(size)
+            self._m_written_lines.inc(lines)
+
+    def _send_to_outputs(self, data: bytes, lines: Optional[int] = None, size: Optional[int] = None) -> bool:
         """Send processed data to all configured output destinations.
 
+        `lines` and `size` override the line and byte counts used for drop
+        metrics, for coalesced frames whose length prefixes are not message
+        data.
         Returns True if at least one send succeeded.
         """
-        labels = {
-            "component_type": getattr(self, "component_type", "core"),
-            "component_id": self.settings.component_id
-        }
         if not self._out_sockets:
             self.log.debug("Engine: No output sockets configured, skipping send")
             return False
 
+        if lines is None:
+            lines = data.count(b'\n') or 1
+        if size is None:
+            size = len(data)
+        debug = self.log.isEnabledFor(logging.DEBUG)
         any_sent = False
         for i, sock in enumerate(self._out_sockets):
             for attempt in range(self.settings.engine_retry_count):
                 try:
-                    self.log.debug(f"Engine: Sending {len(data)} bytes to output socket {i}")
+                    if debug:
+                        self.log.debug("Engine: Sending %d bytes to output socket %d", len(data), i)
                     # Non-blocking send is preferred to avoid stalling the engine loop
                     # Pair0 with block=False will raise TryAgain if the peer is disconnected
                     sock.send(data, block=False)
                     any_sent = True
-                    self.log.debug(f"Engine: Send completed to output socket {i}")
+                    if debug:
+                        self.log.debug("Engine: Send completed to output socket %d", i)
                     break
                 except pynng.TryAgain:
-                    time.sleep(0.01)
-                    if attempt == self.settings.engine_retry_count - 1:
-                        data_dropped_bytes_total.labels(**labels).inc(len(data))
-                        data_dropped_lines_total.labels(**labels).inc(data.count(b'\n') or 1)
+                    # back off on the stop event rather than sleeping, so stop()
+                    # interrupts the retry loop instead of waiting it out
+                    stopping = self._stop_event.wait(0.01)
+                    if stopping or attempt == self.settings.engine_retry_count - 1:
+                        self._m_dropped_bytes.inc(size)
+                        self._m_dropped_lines.inc(lines)
                         self.log.warning(
-                            f"Engine: Output socket {i} not ready or disconnected, dropping message")
+                            "Engine: Output socket %d not ready or disconnected, dropping message", i)
+                        break
                 except pynng.NNGException as e:
-                    data_dropped_bytes_total.labels(**labels).inc(len(data))
-                    data_dropped_lines_total.labels(**labels).inc(data.count(b'\n') or 1)
-                    self.log.error(f"Engine error sending to output socket {i}: {e}")
+                    self._m_dropped_bytes.inc(size)
+                    self._m_dropped_lines.inc(lines)
+                    self.log.error("Engine error sending to output socket %d: %s", i, e)
                     break
         return any_sent
 
@@ -317,9 +466,11 @@ class Engine(ABC):
         self._stop_event.set()
 
         # WAIT for engine loop to exit recv()
-        self._thread.join(timeout=2.0)
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=2.0)
 
-        if self._thread.is_alive():
+        if thread is not None and thread.is_alive():
             raise EngineException("Engine thread failed to stop cleanly")
 
         # Close input socket
@@ -332,9 +483,9 @@ class Engine(ABC):
         for i, sock in enumerate(self._out_sockets):
             try:
                 sock.close()
-                self.log.debug(f"Closed output socket {i}")
+                self.log.debug("Closed output socket %d", i)
             except pynng.NNGException as e:
-                self.log.error(f"Failed to close output socket {i}: {e}")
+                self.log.error("Failed to close output socket %d: %s", i, e)
 
         if self.log:
             self.log.debug("Engine stopped successfully")
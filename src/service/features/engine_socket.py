@@ -1,19 +1,17 @@
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Optional, Protocol, runtime_checkable, cast
+import os
+from typing import Optional, Protocol, cast
 import logging
 import pynng
-import errno
 from urllib.parse import urlparse
 from service.settings import TlsInputConfig
 
 
-@runtime_checkable
 class EngineSocket(Protocol):
     """Minimal socket interface the Engine depends on."""
 
-    def recv(self) -> bytes: ...
+    def recv(self, block: bool = True) -> bytes: ...
     def send(self, data: bytes) -> None: ...
     def close(self) -> None: ...
     def listen(self, addr: str) -> None: ...
@@ -41,17 +39,19 @@ class NngPairSocketFactory:
         logger: logging.Logger,
         tls_config: Optional[TlsInputConfig] = None,
     ) -> EngineSocket:
-        sock = pynng.Pair0()
+        # check the address before creating the socket, so a bad address
+        # never leaves a socket behind
         parsed = urlparse(addr)
+        tls: Optional[pynng.TLSConfig] = None
         if parsed.scheme == "ipc":
-            ipc_path = Path(parsed.path)
+            # remove a stale socket file; a single unlink covers the missing case
             try:
-                if ipc_path.exists():
-                    ipc_path.unlink()
+                os.unlink(parsed.path)
+            except FileNotFoundError:
+                pass
             except OSError as e:
-                if e.errno != errno.ENOENT:
-                    logger.error("Failed to remove IPC file: %s", e)
-                    raise
+                logger.error("Failed to remove IPC file: %s", e)
+                raise
 
         elif parsed.scheme == "tcp":
             if not parsed.port:
@@ -59,19 +59,26 @@ class NngPairSocketFactory:
 
         elif parsed.scheme == "tls+tcp":
             if tls_config is None:
-                sock.close()
                 raise ValueError(
                     f"Address {addr} uses tls+tcp:// but no TLS config was provided. "
                     "Set tls_input in your settings."
                 )
-            cfg = pynng.TLSConfig(
+            tls = pynng.TLSConfig(
                 pynng.TLSConfig.MODE_SERVER,
                 cert_key_file=str(tls_config.cert_key_file),
             )
-            sock.tls_config = cfg
+
+        sock = pynng.Pair0()
+        if tls is not None:
+            sock.tls_config = tls
         try:
             sock.listen(addr)
             return cast(EngineSocket, sock)  # use cast to tell mypy this implements EngineSocket
+        except pynng.AddressInUse:
+            # no port probe beforehand: binding is the check
+            logger.error("Failed to bind to address %s: address already in use", addr)
+            sock.close()
+            raise
         except pynng.NNGException as e:
             logger.error("Failed to bind to address %s: %s", addr, e)
             sock.close()
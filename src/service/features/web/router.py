@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from typing import Any, Dict
 from pydantic import BaseModel
 
@@ -26,8 +26,10 @@ async def admin_stop(service: Any = Depends(get_service)) -> Dict[str, Any]:
 
 
 @router.get("/status")  # type: ignore[misc]
-async def admin_status(service: Any = Depends(get_service)) -> Any:
-    return service._create_status_report(getattr(service, "_running", False))
+async def admin_status(service: Any = Depends(get_service)) -> Response:
+    # status() keeps the encoded report until something in it changes; send
+    # that as-is instead of re-encoding the report dict on every request
+    return Response(content=service.status(), media_type="application/json")
 
 
 @router.post("/reconfigure")  # type: ignore[misc]
@@ -1,12 +1,114 @@
 import os
+import functools
+import hashlib
+import json
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from uuid import uuid5, NAMESPACE_URL
-from typing import Any, Dict, Optional, List, Annotated, Union
+from typing import Any, BinaryIO, Dict, Optional, List, Annotated, Union
 import yaml
 from pydantic import BaseModel, ValidationError, model_validator, UrlConstraints, field_serializer, Field
 from pydantic_core import Url
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Prefer the LibYAML C bindings; fall back to the pure-Python parser.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Parsed YAML keyed by resolved path -> (st_mtime_ns, st_size, data).
+# Entries are reused while the file is unchanged on disk.
+_YAML_CACHE_SIZE = 32
+_yaml_cache: "OrderedDict[str, tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+# Validated settings keyed by (class, path, st_mtime_ns, st_size, env overrides).
+_settings_cache: "OrderedDict[tuple[Any, ...], ServiceSettings]" = OrderedDict()
+
+
+def _json_sidecar(path: Path) -> Path:
+    """Location of the precompiled JSON copy of a YAML file."""
+    return path.with_suffix(path.suffix + ".json")
+
+
+def _read_json_sidecar(path: Path, digest: str, yaml_mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Return the sidecar payload if it is at least as new as the YAML and was
+    built from the same content, otherwise None."""
+    sidecar = _json_sidecar(path)
+    try:
+        if sidecar.stat().st_mtime_ns < yaml_mtime_ns:
+            return None
+        with open(sidecar, "r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("content-version") != digest:
+        return None
+    data = payload.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _write_json_sidecar(path: Path, digest: str, data: Dict[str, Any]) -> None:
+    """Atomically write the JSON sidecar; best effort, never fails the load."""
+    try:
+        # skip content JSON can't represent faithfully (dates, non-str keys, ...)
+        encoded = json.dumps({"content-version": digest, "data": data})
+        if json.loads(encoded)["data"] != data:
+            return
+    except (TypeError, ValueError):
+        return
+
+    sidecar = _json_sidecar(path)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=sidecar.parent, prefix=f".{sidecar.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(encoded)
+            os.replace(tmp, sidecar)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass  # read-only config dir etc. -> just parse the YAML next time
+
+
+def _load_yaml(path: Path, fh: BinaryIO, json_cache: bool = False) -> Dict[str, Any]:
+    """Parse the YAML file open as fh, reusing the cached result if it has
+    not changed.
+
+    With json_cache, a fresh parse also consults (and refreshes) a
+    ``<file>.json`` sidecar so later processes can skip the YAML parser.
+    The returned dict is shared with the cache, so treat it as read-only.
+    """
+    key = str(path.resolve())
+    st = os.fstat(fh.fileno())
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _yaml_cache.move_to_end(key)
+            return cached[2]
+
+    raw = fh.read()
+
+    data: Optional[Dict[str, Any]] = None
+    digest = ""
+    if json_cache:
+        digest = hashlib.md5(raw, usedforsecurity=False).hexdigest()
+        data = _read_json_sidecar(Path(key), digest, st.st_mtime_ns)
+    if data is None:
+        data = yaml.load(raw, Loader=_YamlLoader) or {}  # nosec B506
+        if json_cache and isinstance(data, dict):
+            _write_json_sidecar(Path(key), digest, data)
+
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (st.st_mtime_ns, st.st_size, data)
+        _yaml_cache.move_to_end(key)
+        while len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    return data
+
 
 class TlsInputConfig(BaseModel):
     """TLS configuration for the input/listener socket.
@@ -63,6 +165,13 @@ class ServiceSettings(BaseSettings):
     engine_recv_timeout: int = 100  # milliseconds
     engine_retry_count: int = Field(default=10, ge=1)
     engine_buffer_size: int = Field(default=100, ge=0, le=8192)
+    # drain up to engine_batch_size queued messages (waiting at most
+    # engine_batch_ms) per loop iteration and process them together
+    engine_batch_size: int = Field(default=16, ge=1)
+    engine_batch_ms: int = Field(default=10, ge=0)  # milliseconds
+    # > 0: send each batch's outputs as length-prefixed frames of up to this
+    # many bytes (see service.features.engine.unpack_frames); 0 sends one by one
+    engine_max_batch_bytes: int = Field(default=0, ge=0)
 
     # Output addresses (strongly typed URLs)
     out_addr: List[NngAddr] = Field(default_factory=list)
@@ -74,9 +183,16 @@ class ServiceSettings(BaseSettings):
     tls_output: Optional[TlsOutputConfig] = None
 
     # HTTP server (FastAPI) settings
+    http_enabled: bool = True  # False runs without the admin API / metrics endpoint
     http_host: str = "127.0.0.1"
     http_port: int = 8000
 
+    # upper bound (seconds) for run() to wait for the admin server on shutdown
+    shutdown_timeout: float = Field(default=5.0, ge=0)
+
+    # observe processing_duration_seconds for every n-th processed message
+    metrics_sample_rate: int = Field(default=1, ge=1)
+
     model_config = SettingsConfigDict(
         env_prefix="DETECTMATE_",  # DETECTMATE_LOG_LEVEL etc.
         env_nested_delimiter="__",  # DETECTMATE_DETECTOR__THRESHOLD
@@ -132,42 +248,91 @@ class ServiceSettings(BaseSettings):
         return self
 
     @classmethod
-    def from_yaml(cls, path: str | Path | None) -> "ServiceSettings":
-        """Utility for one-liner loading w/ override by env vars."""
-        data: Dict[str, Any] = {}
+    def from_yaml(cls, path: str | Path | None, json_cache: bool = False) -> "ServiceSettings":
+        """Utility for one-liner loading w/ override by env vars.
+
+        Set json_cache to keep a precompiled ``<file>.json`` next to the
+        YAML, which repeated process start-ups read instead of reparsing.
+        """
         if path:
-            path = Path(path)
-            if path.exists():
-                try:
-                    with open(path, "r") as fh:
-                        data = yaml.safe_load(fh) or {}
-                except (IOError, yaml.YAMLError) as e:
-                    raise SystemExit(f"[config] Error reading YAML file {path}: {e}") from e
+            try:
+                with open(path, "rb") as fh:
+                    return cls.from_yaml_fh(fh, json_cache=json_cache)
+            except FileNotFoundError:
+                pass  # fall back to defaults + env vars
+            except OSError as e:
+                raise SystemExit(f"[config] Error reading YAML file {path}: {e}") from e
+        return cls._from_yaml_source(None, json_cache)
 
-        # convert string paths to Path objects
-        if "log_dir" in data and isinstance(data["log_dir"], str):
-            data["log_dir"] = Path(data["log_dir"])
+    @classmethod
+    def from_yaml_fh(cls, fh: BinaryIO, json_cache: bool = False) -> "ServiceSettings":
+        """Like from_yaml, for a YAML file the caller already opened in
+        binary mode."""
+        return cls._from_yaml_source(fh, json_cache)
+
+    @classmethod
+    @functools.cache
+    def _env_field_map(cls) -> tuple[tuple[str, str], ...]:
+        """(field, environment variable) pairs; fields are fixed per class."""
+        prefix = cls.model_config["env_prefix"]
+        return tuple((field, f"{prefix}{field.upper()}") for field in cls.model_fields)
+
+    @classmethod
+    def _from_yaml_source(cls, fh: Optional[BinaryIO], json_cache: bool) -> "ServiceSettings":
+        # check which fields have environment variable values; usually none
+        # are set, and one pass over the names is cheaper than a probe per field
+        environ = os.environ
+        prefix = cls.model_config["env_prefix"]
+        env_values: Dict[str, str] = {}
+        if any(name.startswith(prefix) for name in environ):
+            env_values = {
+                field: environ[env_name] for field, env_name in cls._env_field_map() if env_name in environ
+            }
+
+        # an unchanged file with the same env overrides validates to the same
+        # settings, so reuse the validated model (validation dominates here)
+        data: Dict[str, Any] = {}
+        cache_key: Optional[tuple[Any, ...]] = None
+        if fh is not None:
+            path = Path(fh.name)
+            try:
+                st = os.fstat(fh.fileno())
+                cache_key = (cls, str(path.resolve()), st.st_mtime_ns, st.st_size,
+                             tuple(sorted(env_values.items())))
+                with _yaml_cache_lock:
+                    cached = _settings_cache.get(cache_key)
+                    if cached is not None:
+                        _settings_cache.move_to_end(cache_key)
+                if cached is not None:
+                    # callers may mutate their settings, so hand out a copy
+                    return cached.model_copy(deep=True)
 
-        # check which fields have environment variable values
-        env_fields = set()
-        for field in cls.model_fields:
-            env_name = f"{cls.model_config['env_prefix']}{field.upper()}"
-            if env_name in os.environ:
-                env_fields.add(field)
+                # read-only: final_data below is a fresh dict and
+                # validation builds its own containers
+                data = _load_yaml(path, fh, json_cache=json_cache)
+            except (IOError, yaml.YAMLError) as e:
+                raise SystemExit(f"[config] Error reading YAML file {path}: {e}") from e
 
         # create a dictionary with final values (env vars override yaml)
-        final_data = {}
-        for field in cls.model_fields:
-            if field in env_fields:
-                # get the value from environment (let Pydantic handle parsing)
-                env_name = f"{cls.model_config['env_prefix']}{field.upper()}"
-                final_data[field] = os.environ[env_name]
-            elif field in data:
-                final_data[field] = data[field]  # use yaml value if no env var
-            else:
-                continue  # pydantic will handle default values
+        # (pydantic handles default values for fields set in neither)
+        final_data: Dict[str, Any] = {field: data[field] for field in cls.model_fields if field in data}
+        # values from the environment are left for Pydantic to parse
+        final_data.update(env_values)
+
+        # convert string paths to Path objects
+        if isinstance(final_data.get("log_dir"), str):
+            final_data["log_dir"] = Path(final_data["log_dir"])
 
         try:
-            return cls.model_validate(final_data)
+            settings = cls.model_validate(final_data)
         except ValidationError as e:
             raise SystemExit(f"[config] x {e}") from e
+
+        if cache_key is None:
+            return settings
+        with _yaml_cache_lock:
+            _settings_cache[cache_key] = settings
+            while len(_settings_cache) > _YAML_CACHE_SIZE:
+                _settings_cache.popitem(last=False)
+        # the cached model may share values with the cached YAML dict
+        return settings.model_copy(deep=True)
@@ -3,46 +3,52 @@ import json
 import signal
 import yaml
 import sys
-from subprocess import Popen, PIPE, TimeoutExpired
+import httpx
+from subprocess import Popen, TimeoutExpired
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
 
 AUDIT_LOG = "tests/library_integration/audit.log"
 
 
 def start_service(module_path, settings, config, settings_file, config_file):
     with open(settings_file, "w") as f:
-        yaml.dump(settings, f)
+        yaml.dump(settings, f, Dumper=YamlDumper)
     with open(config_file, "w") as f:
-        yaml.dump(config, f)
+        yaml.dump(config, f, Dumper=YamlDumper)
     url = f"http://{settings['http_host']}:{settings['http_port']}"
     proc = Popen([sys.executable, "-m", "service.cli", "--settings",
                  str(settings_file), "--config", str(config_file)], cwd=module_path)
 
-    max_retries = 10
-    for attempt in range(max_retries):
-        status = Popen([sys.executable, "-m", "service.client", "--url",
-                       url, "status"], cwd=module_path, stdout=PIPE)
-        stdout = status.communicate(timeout=5)
-        time.sleep(1)
-        try:
-            data = json.loads(stdout[0])
-            if data.get("status", {}).get("running"):
-                break
-        except json.JSONDecodeError:
-            # Service may not yet be returning valid JSON; ignore and retry until max_retries is reached.
-            pass
-        if attempt == max_retries - 1:
-            proc.terminate()
-            proc.wait(timeout=5)
-            raise RuntimeError(f"Service not ready within {max_retries} attempts")
-        time.sleep(0.2)
+    # poll the admin API in-process instead of starting a client per attempt
+    max_retries = 200
+    with httpx.Client(timeout=5) as client:
+        for attempt in range(max_retries):
+            try:
+                data = client.get(f"{url}/admin/status").json()
+                if data.get("status", {}).get("running"):
+                    break
+            except (httpx.HTTPError, json.JSONDecodeError):
+                # Service may not be listening or returning valid JSON yet; retry until max_retries.
+                pass
+            if attempt == max_retries - 1:
+                proc.terminate()
+                proc.wait(timeout=5)
+                raise RuntimeError(f"Service not ready within {max_retries} attempts")
+            time.sleep(0.05)
     return proc, url
 
 
 def cleanup_service(module_path, proc, url):
-    stop = Popen([sys.executable, "-m", "service.client", "--url", url, "stop"], cwd=module_path)
-    stop.communicate(timeout=5)
-    proc.send_signal(signal.SIGINT)
+    # shut down through the admin API: the service's main thread waits on its
+    # exit event, and a SIGINT that lands on another thread does not wake it
+    try:
+        httpx.post(f"{url}/admin/shutdown", timeout=5)
+    except httpx.HTTPError:
+        proc.send_signal(signal.SIGINT)
     try:
         proc.wait(timeout=5)
     except TimeoutExpired:
@@ -49,139 +49,132 @@ def running_detector_service(tmp_path: Path) -> Generator[dict, None, None]:
     cleanup_service(module_path, proc, url)
 
 
+@pytest.fixture(scope="function")
+def engine_socket(running_detector_service: dict) -> Generator[pynng.Pair0, None, None]:
+    """Socket dialed to the engine once per test; all of the test's messages
+    go through it."""
+    with pynng.Pair0(dial=running_detector_service["engine_addr"], recv_timeout=2000) as socket:
+        yield socket
+
+
 class TestDetectorServiceViaEngine:
     """Tests for detection via the engine socket."""
 
-    def test_engine_socket_connection(self, running_detector_service: dict) -> None:
+    def test_engine_socket_connection(self, engine_socket: pynng.Pair0) -> None:
         """Verify we can connect to the engine socket."""
-        engine_addr = running_detector_service["engine_addr"]
-        with pynng.Pair0(dial=engine_addr, recv_timeout=1000) as socket:
-            assert socket is not None, "Should successfully connect to engine socket"
+        assert engine_socket is not None, "Should successfully connect to engine socket"
 
     @pytest.mark.parametrize("message_index", [0, 1, 2])
     def test_individual_messages(
-        self, running_detector_service: dict, test_parser_messages: list, message_index: int
+        self, engine_socket: pynng.Pair0, test_parser_messages: list, message_index: int
     ) -> None:
         """Parameterized test for individual message types.
 
         Timeout means no detection occurred (detector returned False).
         Response means detection occurred (detector returned True).
         """
-        engine_addr = running_detector_service["engine_addr"]
-
-        with pynng.Pair0(dial=engine_addr, recv_timeout=2000) as socket:
-            socket.send(test_parser_messages[message_index])
-
-            try:
-                response = socket.recv()
-                # If we get here, detection occurred
-                assert response is not None
-                assert len(response) > 0
-
-                # Verify it's a valid DetectorSchema
-                (detector_schema := DetectorSchema()).deserialize(response)
-                assert detector_schema.score == 1.0
-                assert detector_schema.description == "Dummy detection process"
-            except pynng.Timeout:
-                # Timeout means detector returned False/None (no detection)
-                pass
+        engine_socket.send(test_parser_messages[message_index])
+
+        try:
+            response = engine_socket.recv()
+            # If we get here, detection occurred
+            assert response is not None
+            assert len(response) > 0
+
+            # Verify it's a valid DetectorSchema
+            (detector_schema := DetectorSchema()).deserialize(response)
+            assert detector_schema.score == 1.0
+            assert detector_schema.description == "Dummy detection process"
+        except pynng.Timeout:
+            # Timeout means detector returned False/None (no detection)
+            pass
 
     def test_alternating_detection_pattern(
-        self, running_detector_service: dict, test_parser_messages: list
+        self, engine_socket: pynng.Pair0, test_parser_messages: list
     ) -> None:
         """Verify the alternating detection pattern: False, True, False.
 
         DummyDetector alternates: 1st call = no detection, 2nd = detection, 3rd = no detection.
         """
-        engine_addr = running_detector_service["engine_addr"]
         results = []
 
         for i, parser_message in enumerate(test_parser_messages):
-            with pynng.Pair0(dial=engine_addr, recv_timeout=2000) as socket:
-                socket.send(parser_message)
+            engine_socket.send(parser_message)
 
-                try:
-                    response = socket.recv()
-                    # Detection occurred
-                    (detector_schema := DetectorSchema()).deserialize(response)
-                    assert detector_schema.score == 1.0
-                    results.append(True)
-                except pynng.Timeout:
-                    # No detection (timeout)
-                    results.append(False)
+            try:
+                response = engine_socket.recv()
+                # Detection occurred
+                (detector_schema := DetectorSchema()).deserialize(response)
+                assert detector_schema.score == 1.0
+                results.append(True)
+            except pynng.Timeout:
+                # No detection (timeout)
+                results.append(False)
 
         # Verify alternating pattern: False, True, False
         expected_pattern = [False, True, False]
         assert results == expected_pattern, f"Expected {expected_pattern}, got {results}"
 
     def test_detection_result_structure(
-        self, running_detector_service: dict, test_parser_messages: list
+        self, engine_socket: pynng.Pair0, test_parser_messages: list
     ) -> None:
         """Verify detection result has proper structure when detection
         occurs."""
-        engine_addr = running_detector_service["engine_addr"]
-
         # First message will NOT trigger detection (pattern: False, True, False)
         # So send first message to advance counter, then second message for detection
-        with pynng.Pair0(dial=engine_addr, recv_timeout=2000) as socket:
-            socket.send(test_parser_messages[0])
-            try:
-                socket.recv()
-            except pynng.Timeout:
-                pass  # Expected
+        engine_socket.send(test_parser_messages[0])
+        try:
+            engine_socket.recv()
+        except pynng.Timeout:
+            pass  # Expected
 
         # Second message WILL trigger detection
-        with pynng.Pair0(dial=engine_addr, recv_timeout=2000) as socket:
-            socket.send(test_parser_messages[1])
-
-            try:
-                response = socket.recv()
-                (detector_schema := DetectorSchema()).deserialize(response)
-                # Verify structure
-                assert detector_schema.description == "Dummy detection process"
-                assert detector_schema.score == 1.0
-                assert "type" in detector_schema.alertsObtain
-                assert "Anomaly detected by DummyDetector" in detector_schema.alertsObtain["type"]
-            except pynng.Timeout:
-                pytest.fail("Second message should have triggered detection")
+        engine_socket.send(test_parser_messages[1])
+
+        try:
+            response = engine_socket.recv()
+            (detector_schema := DetectorSchema()).deserialize(response)
+            # Verify structure
+            assert detector_schema.description == "Dummy detection process"
+            assert detector_schema.score == 1.0
+            assert "type" in detector_schema.alertsObtain
+            assert "Anomaly detected by DummyDetector" in detector_schema.alertsObtain["type"]
+        except pynng.Timeout:
+            pytest.fail("Second message should have triggered detection")
 
     def test_no_detection_returns_timeout(
-        self, running_detector_service: dict, test_parser_messages: list
+        self, engine_socket: pynng.Pair0, test_parser_messages: list
     ) -> None:
         """Verify that no detection results in timeout (no response sent).
 
         Pattern is False, True, False - so 1st and 3rd calls should timeout.
         """
-        engine_addr = running_detector_service["engine_addr"]
         # First call does NOT trigger detection (pattern: False)
-        with pynng.Pair0(dial=engine_addr, recv_timeout=2000) as socket:
-            socket.send(test_parser_messages[0])
-            with pytest.raises(pynng.Timeout):
-                socket.recv()
-                pytest.fail("Expected timeout but received response")
+        engine_socket.send(test_parser_messages[0])
+        with pytest.raises(pynng.Timeout):
+            engine_socket.recv()
+            pytest.fail("Expected timeout but received response")
 
     def test_consecutive_messages_with_mixed_results(
-        self, running_detector_service: dict, test_parser_messages: list
+        self, engine_socket: pynng.Pair0, test_parser_messages: list
     ) -> None:
         """Test consecutive messages tracking both detections and non-
         detections."""
-        engine_addr = running_detector_service["engine_addr"]
         detection_count = 0
         no_detection_count = 0
 
         for i, parser_message in enumerate(test_parser_messages):
-            with pynng.Pair0(dial=engine_addr, recv_timeout=2000) as socket:
-                socket.send(parser_message)
-
-                try:
-                    response = socket.recv()
-                    if response is not None and len(response) > 0:
-                        (detector_schema := DetectorSchema()).deserialize(response)
-                        assert detector_schema.score == 1.0
-                        detection_count += 1
-                except pynng.Timeout:
-                    # No detection occurred
-                    no_detection_count += 1
+            engine_socket.send(parser_message)
+
+            try:
+                response = engine_socket.recv()
+                if response is not None and len(response) > 0:
+                    (detector_schema := DetectorSchema()).deserialize(response)
+                    assert detector_schema.score == 1.0
+                    detection_count += 1
+            except pynng.Timeout:
+                # No detection occurred
+                no_detection_count += 1
 
         # All 3 messages should be processed
         total_processed = detection_count + no_detection_count
@@ -192,22 +185,19 @@ class TestDetectorServiceViaEngine:
         assert no_detection_count == 2, f"Expected 2 no-detections, got {no_detection_count}"
 
     def test_detection_score_always_1_when_present(
-        self, running_detector_service: dict, test_parser_messages: list
+        self, engine_socket: pynng.Pair0, test_parser_messages: list
     ) -> None:
         """Verify that when detection occurs, score is always 1.0."""
-        engine_addr = running_detector_service["engine_addr"]
-
         # Try all messages and collect scores from successful detections
         scores = []
         for parser_message in test_parser_messages:
-            with pynng.Pair0(dial=engine_addr, recv_timeout=2000) as socket:
-                socket.send(parser_message)
-                try:
-                    response = socket.recv()
-                    (detector_schema := DetectorSchema()).deserialize(response)
-                    scores.append(detector_schema.score)
-                except pynng.Timeout:
-                    pass  # No detection, skip
+            engine_socket.send(parser_message)
+            try:
+                response = engine_socket.recv()
+                (detector_schema := DetectorSchema()).deserialize(response)
+                scores.append(detector_schema.score)
+            except pynng.Timeout:
+                pass  # No detection, skip
 
         # All collected scores should be 1.0
         for score in scores:
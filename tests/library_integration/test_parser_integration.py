@@ -187,7 +187,6 @@ class TestParserServiceViaEngine:
                 assert parser_schema.variables == ["dummy_variable"]
                 assert parser_schema.template == "This is a dummy template"
                 responses_received.append(parser_schema)
-                time.sleep(0.2)
         assert len(responses_received) == 3
 
     def test_consistent_parsing_across_messages(
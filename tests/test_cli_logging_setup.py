@@ -1,9 +1,11 @@
 import logging
 import io
 from contextlib import redirect_stdout, redirect_stderr
+import sys
 import pytest
 
-from service.cli import setup_logging, logger
+import service.core
+from service.cli import main, setup_logging, logger
 
 
 @pytest.fixture(autouse=True)
@@ -82,3 +84,33 @@ def test_logging_level_filtering():
 
     # verify error messages appear in stderr
     assert "error" in stderr_output.lower()
+
+
+class _DummyService:
+    def __init__(self, settings):
+        self.settings = settings
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self):
+        pass
+
+
+@pytest.mark.parametrize("extra_args, sidecar_written", [
+    ([], False),
+    (["--settings-json-cache"], True),
+])
+def test_cli_settings_json_cache_is_opt_in(tmp_path, monkeypatch, extra_args, sidecar_written):
+    """Test that the CLI only writes the settings sidecar when asked to."""
+    settings_file = tmp_path / "settings.yaml"
+    settings_file.write_text("component_name: cli_test\n")
+    monkeypatch.setattr(service.core, "Service", _DummyService)
+    monkeypatch.setattr(sys, "argv", ["detectmate", "--settings", str(settings_file), *extra_args])
+
+    main()
+
+    assert (tmp_path / "settings.yaml.json").exists() is sidecar_written
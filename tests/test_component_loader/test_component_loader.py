@@ -3,7 +3,7 @@ import types
 import pytest
 
 from detectmatelibrary.common.core import CoreComponent
-from service.features.component_loader import ComponentLoader
+from service.features.component_loader import ComponentLoader, cached_import
 
 
 @pytest.fixture(autouse=True)
@@ -207,3 +207,12 @@ def test_load_component_type_mismatch_raises_runtime_error(monkeypatch):
     msg = str(excinfo.value)
     assert "Failed to load component detectors.RandomDetector" in msg
     assert "not a CoreComponent" in msg
+
+
+def test_cached_import_returns_loaded_module():
+    """Already imported modules come straight from sys.modules."""
+    import detectmatelibrary.common.core as core_module
+
+    assert cached_import("detectmatelibrary.common.core") is core_module
+    with pytest.raises(ImportError):
+        cached_import("nonexistentpkg.detectors")
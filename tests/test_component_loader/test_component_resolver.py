@@ -0,0 +1,42 @@
+"""Tests for resolving short component names to dotted paths."""
+import pytest
+
+from service.features.component_resolver import ComponentResolver
+
+
+@pytest.fixture(autouse=True)
+def fresh_resolver():
+    ComponentResolver.resolve.cache_clear()
+    yield
+    ComponentResolver.resolve.cache_clear()
+
+
+@pytest.mark.parametrize("short_name, component_path, config_path", [
+    # re-exported by the package: the package path is the public name
+    ("NewValueDetector",
+     "detectmatelibrary.detectors.NewValueDetector",
+     "detectmatelibrary.detectors.NewValueDetectorConfig"),
+    # defined in a private module, first exported by a public one
+    ("MatcherParser",
+     "detectmatelibrary.parsers.json_parser.MatcherParser",
+     "detectmatelibrary.parsers.json_parser.MatcherParserConfig"),
+])
+def test_short_names_resolve_to_public_module(short_name, component_path, config_path):
+    """The resolved path ends up in component_type (logger names, log files,
+    metric labels), so it must stay stable."""
+    assert ComponentResolver.resolve(short_name) == (component_path, config_path)
+
+
+def test_resolved_modules_are_never_private():
+    component_path, _ = ComponentResolver.resolve("MatcherParser")
+    assert not any(part.startswith("_") for part in component_path.split("."))
+
+
+def test_dotted_path_is_returned_as_is():
+    path = "detectmatelibrary.detectors.new_value_detector.NewValueDetector"
+    assert ComponentResolver.resolve(path)[0] == path
+
+
+def test_unknown_short_name_raises():
+    with pytest.raises(ImportError):
+        ComponentResolver.resolve("NoSuchComponentAnywhere")
@@ -132,3 +132,22 @@ def test_load_config_class_type_mismatch_raises_type_error(monkeypatch):
 
     msg = str(excinfo.value)
     assert "Config class LogFileConfig must inherit from CoreConfig" in msg
+
+
+def test_load_config_class_is_cached_until_module_changes(monkeypatch):
+    """Repeated loads return the cached class; replacing the module in
+    sys.modules invalidates the cached entry."""
+    monkeypatch.setattr(ConfigClassLoader, "BASE_PACKAGE", "testpkg")
+
+    first = _create_fake_module(
+        module_name="testpkg.readers.cached",
+        class_name="CachedConfig",
+    )
+    assert ConfigClassLoader.load_config_class("readers.cached.CachedConfig") is first
+    assert ConfigClassLoader.load_config_class("readers.cached.CachedConfig") is first
+
+    second = _create_fake_module(
+        module_name="testpkg.readers.cached",
+        class_name="CachedConfig",
+    )
+    assert ConfigClassLoader.load_config_class("readers.cached.CachedConfig") is second
@@ -143,3 +143,62 @@ def test_env_vars_override_yaml(tmpdir, monkeypatch):
 
     # Verify that component_id was generated
     assert settings.component_id is not None
+
+
+def test_from_yaml_picks_up_file_changes(tmp_path):
+    """Test that cached YAML is re-read once the file changes on disk."""
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text(yaml.dump({'component_name': 'first', 'log_level': 'DEBUG'}))
+
+    first = ServiceSettings.from_yaml(config_file)
+    # loading again must not share state with the previous instance
+    first.log_level = 'ERROR'
+    again = ServiceSettings.from_yaml(config_file)
+    assert again.component_name == 'first'
+    assert again.log_level == 'DEBUG'
+
+    config_file.write_text(yaml.dump({'component_name': 'second-name', 'log_level': 'WARNING'}))
+    changed = ServiceSettings.from_yaml(config_file)
+    assert changed.component_name == 'second-name'
+    assert changed.log_level == 'WARNING'
+
+
+def test_from_yaml_json_cache_sidecar(tmp_path):
+    """Test that json_cache writes a sidecar and ignores it once stale."""
+    config_file = tmp_path / 'settings.yaml'
+    config_file.write_text(yaml.dump({'component_name': 'cached', 'log_level': 'DEBUG'}))
+
+    settings = ServiceSettings.from_yaml(config_file, json_cache=True)
+    assert settings.component_name == 'cached'
+
+    sidecar = tmp_path / 'settings.yaml.json'
+    assert sidecar.exists()
+    assert ServiceSettings.from_yaml(config_file, json_cache=True).log_level == 'DEBUG'
+
+    config_file.write_text(yaml.dump({'component_name': 'edited-name', 'log_level': 'ERROR'}))
+    settings = ServiceSettings.from_yaml(config_file, json_cache=True)
+    assert settings.component_name == 'edited-name'
+    assert settings.log_level == 'ERROR'
+
+
+def test_from_yaml_cached_settings_follow_env(tmp_path, monkeypatch):
+    """Test that a cached load is not reused once env overrides change."""
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text(yaml.dump({'component_name': 'yaml_detector', 'log_level': 'DEBUG'}))
+
+    assert ServiceSettings.from_yaml(config_file).log_level == 'DEBUG'
+    monkeypatch.setenv('DETECTMATE_LOG_LEVEL', 'ERROR')
+    assert ServiceSettings.from_yaml(config_file).log_level == 'ERROR'
+    monkeypatch.delenv('DETECTMATE_LOG_LEVEL')
+    assert ServiceSettings.from_yaml(config_file).log_level == 'DEBUG'
+
+
+def test_from_yaml_fh(tmp_path):
+    """Test loading settings from an already open file handle."""
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text(yaml.dump({'component_name': 'from_handle', 'log_level': 'WARNING'}))
+
+    with open(config_file, 'rb') as fh:
+        settings = ServiceSettings.from_yaml_fh(fh)
+    assert settings.component_name == 'from_handle'
+    assert settings.log_level == 'WARNING'
@@ -5,6 +5,7 @@ import pynng
 import httpx
 import pytest
 from contextlib import contextmanager
+from prometheus_client import REGISTRY
 from service.settings import ServiceSettings
 from service.core import Service
 
@@ -12,14 +13,22 @@ from service.core import Service
 class MockComponent(Service):
     component_type = "test"
 
-    def process(self, raw_message: bytes) -> bytes | None:
+    def process(self, raw_message: bytes) -> bytes | bytearray | str | None:
         if raw_message == b"boom":
             raise ValueError("boom!")
         if raw_message == b"skip":
             return None
+        if raw_message == b"buffer":
+            return bytearray(raw_message[::-1])
+        if raw_message == b"text":
+            return "not bytes"
         return raw_message[::-1]
 
 
+class PassthroughComponent(Service):
+    component_type = "passthrough_test"
+
+
 @contextmanager
 def pair_socket(addr: str, recv_timeout: int = 100):
     """Context manager for PAIR socket with automatic cleanup."""
@@ -99,3 +108,80 @@ def test_admin_stop(comp):
     assert response.status_code == 200
     time.sleep(0.1)
     assert comp._running is False
+
+
+def test_burst_processed_in_order(comp):
+    """Queued messages are drained in batches without reordering or loss."""
+    payloads = [f"msg-{i:02d}".encode() for i in range(40)]
+    with pair_socket(comp.settings.engine_addr, recv_timeout=2000) as sock:
+        for payload in payloads:
+            sock.send(payload)
+        received = [sock.recv() for _ in payloads]
+    assert received == [p[::-1] for p in payloads]
+
+
+def test_failing_message_does_not_drop_batch(comp):
+    """An exception for one message only drops that message."""
+    with pair_socket(comp.settings.engine_addr, recv_timeout=1000) as sock:
+        for payload in (b"first", b"boom", b"last"):
+            sock.send(payload)
+        assert sock.recv() == b"tsrif"
+        assert sock.recv() == b"tsal"
+
+
+def test_bytearray_output_is_sent(comp):
+    """Bytes-like processor results are sent like bytes."""
+    with pair_socket(comp.settings.engine_addr) as sock:
+        sock.send(b"buffer")
+        assert sock.recv() == b"reffub"
+
+
+def test_non_bytes_output_is_dropped(comp):
+    """A result that is not bytes-like is counted as an error and not sent."""
+    labels = {"component_type": "test", "component_id": comp.component_id}
+    errors_before = REGISTRY.get_sample_value("processing_errors_total", labels) or 0.0
+    with pair_socket(comp.settings.engine_addr, recv_timeout=1000) as sock:
+        sock.send(b"text")
+        sock.send(b"last")
+        assert sock.recv() == b"tsal"
+    assert REGISTRY.get_sample_value("processing_errors_total", labels) == errors_before + 1
+
+
+def test_processed_counters_published_per_batch(tmp_path, service_thread, free_port):
+    """Processed bytes/lines are counted per message and reach the
+    Prometheus counters once the engine has handled the batch."""
+    settings = ServiceSettings(
+        engine_addr=f"ipc://{tmp_path}/t_counters.ipc",
+        engine_autostart=True,
+        http_port=free_port
+    )
+    svc = PassthroughComponent(settings=settings)
+    labels = {"component_type": "passthrough_test", "component_id": svc.component_id}
+    bytes_before = REGISTRY.get_sample_value("data_processed_bytes_total", labels) or 0.0
+    lines_before = REGISTRY.get_sample_value("data_processed_lines_total", labels) or 0.0
+    service_thread(svc)
+
+    with pair_socket(svc.settings.engine_addr, recv_timeout=1000) as sock:
+        for payload in (b"a\nb", b"cd"):
+            sock.send(payload)
+            assert sock.recv() == payload
+
+    assert REGISTRY.get_sample_value("data_processed_bytes_total", labels) == bytes_before + 5
+    assert REGISTRY.get_sample_value("data_processed_lines_total", labels) == lines_before + 2
+
+
+def test_processed_counters_published_outside_engine_loop(tmp_path, free_port):
+    """Calling process() directly publishes its counts right away."""
+    settings = ServiceSettings(
+        engine_addr=f"ipc://{tmp_path}/t_direct.ipc",
+        http_port=free_port
+    )
+    svc = PassthroughComponent(settings=settings)
+    labels = {"component_type": "passthrough_test", "component_id": svc.component_id}
+    bytes_before = REGISTRY.get_sample_value("data_processed_bytes_total", labels) or 0.0
+    lines_before = REGISTRY.get_sample_value("data_processed_lines_total", labels) or 0.0
+
+    assert svc.process(b"a\nb") == b"a\nb"
+
+    assert REGISTRY.get_sample_value("data_processed_bytes_total", labels) == bytes_before + 3
+    assert REGISTRY.get_sample_value("data_processed_lines_total", labels) == lines_before + 1
@@ -4,9 +4,10 @@ import time
 import pynng
 from contextlib import contextmanager
 from pydantic import ValidationError
+from prometheus_client import REGISTRY
 
 from service.settings import ServiceSettings
-from service.features.engine import Engine
+from service.features.engine import Engine, unpack_frames
 
 
 # Timing constants
@@ -446,3 +447,47 @@ def test_large_message_handling(ipc_paths, engine_manager, receiver_manager):
             result = receiver.recv()
             assert len(result) > 1024 * 1024
             assert result.startswith(b"PROCESSED: ")
+
+
+def test_coalesced_output_frames(ipc_paths, engine_manager):
+    """With engine_max_batch_bytes set, outputs arrive as length-prefixed frames."""
+    settings = create_settings(ipc_paths, [ipc_paths['out1']])
+    settings.engine_max_batch_bytes = 64
+
+    with pair_socket('listen', ipc_paths['out1']) as receiver, \
+            pair_socket('dial', ipc_paths['engine']) as sender:
+        engine = engine_manager(settings)
+        engine.start()
+        time.sleep(CONNECTION_DELAY)
+
+        messages = [f"msg{i}".encode() for i in range(20)]
+        for msg in messages:
+            sender.send(msg)
+
+        received = []
+        while len(received) < len(messages):
+            frame = receiver.recv()
+            assert len(frame) <= 64
+            received.extend(unpack_frames(frame))
+        assert received == [b"PROCESSED: " + msg.upper() for msg in messages]
+
+
+def test_dropped_coalesced_frame_counts_payload_bytes(ipc_paths, engine_manager):
+    """A dropped frame counts its payload bytes, not the length prefixes."""
+    settings = create_settings(ipc_paths, [ipc_paths['out1']])
+    engine = engine_manager(settings)
+    engine._out_sockets[0].close()  # every send now fails
+    labels = {"component_type": "core", "component_id": settings.component_id}
+    before = REGISTRY.get_sample_value("data_dropped_bytes_total", labels) or 0.0
+
+    engine._emit_coalesced([b"one", b"two\n", b"three"])
+
+    assert REGISTRY.get_sample_value("data_dropped_bytes_total", labels) == before + 12
+
+
+def test_unpack_frames_rejects_truncated_data():
+    """A frame shorter than its length prefix is rejected."""
+    assert unpack_frames(b"") == []
+    assert unpack_frames(b"\x00\x00\x00\x02hi\x00\x00\x00\x00") == [b"hi", b""]
+    with pytest.raises(ValueError):
+        unpack_frames(b"\x00\x00\x00\x05hi")
@@ -1,7 +1,6 @@
 """Tests for engine socket factory error handling."""
 import errno
 import socket
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pynng
@@ -78,7 +77,8 @@ def test_ipc_cleanup_permission_error(tmp_path, mock_logger):
 
     factory = NngPairSocketFactory()
 
-    with patch.object(Path, "unlink", side_effect=OSError(errno.EPERM, "Permission denied")):
+    with patch("service.features.engine_socket.os.unlink",
+               side_effect=OSError(errno.EPERM, "Permission denied")):
         with pytest.raises(OSError, match="Permission denied"):
             factory.create(f"ipc://{ipc_file}", mock_logger)
 
@@ -1,3 +1,4 @@
+import json
 import pytest
 import yaml
 import socket
@@ -320,3 +321,116 @@ def test_reconfigure_empty_events(test_service, temp_config_file):
 
     # Should handle empty events gracefully
     assert disk_data["detectors"]["TestDetector"]["events"] == {}
+
+
+def test_status_report_reflects_reconfigure(test_service):
+    """Test that the cached config dump in the status report follows updates."""
+    before = test_service._create_status_report(running=False)
+    assert 1 in before["configs"]["detectors"]["TestDetector"]["events"]
+
+    new_config = {
+        "detectors": {
+            "TestDetector": {
+                "method_type": "new_value_detector",
+                "events": {
+                    7: {
+                        "default": {
+                            "params": {},
+                            "variables": [{"pos": 0, "name": "var_7"}]
+                        }
+                    }
+                }
+            }
+        }
+    }
+    assert test_service.reconfigure(config_data=new_config) == "reconfigure: ok"
+
+    after = test_service._create_status_report(running=False)
+    assert list(after["configs"]["detectors"]["TestDetector"]["events"]) == [7]
+    assert after["settings"] is before["settings"]
+
+
+def test_status_json_follows_reconfigure(test_service):
+    """Test that status() output is reused only while the config is unchanged."""
+    first = test_service.status()
+    assert test_service.status() is first
+    assert "1" in json.loads(first)["configs"]["detectors"]["TestDetector"]["events"]
+
+    new_config = {
+        "detectors": {
+            "TestDetector": {
+                "method_type": "new_value_detector",
+                "events": {
+                    8: {
+                        "default": {
+                            "params": {},
+                            "variables": [{"pos": 0, "name": "var_8"}]
+                        }
+                    }
+                }
+            }
+        }
+    }
+    assert test_service.reconfigure(config_data=new_config) == "reconfigure: ok"
+
+    events = json.loads(test_service.status())["configs"]["detectors"]["TestDetector"]["events"]
+    assert list(events) == ["8"]
+
+
+def test_status_json_cache_hit_skips_report(test_service):
+    """Test that a cached status() does not rebuild the report."""
+    first = test_service.status()
+    with patch.object(MockService, '_create_status_report') as report:
+        assert test_service.status() is first
+    report.assert_not_called()
+
+
+def test_status_json_follows_in_place_dict_change(test_service, temp_config_file):
+    """Test that status() is rebuilt after a dict config is changed in place and saved."""
+    test_service.config_manager = ConfigManager(str(temp_config_file), None, test_service.log)
+    first = test_service.status()
+    assert test_service.status() is first
+
+    test_service.config_manager.get()["detectors"]["TestDetector"]["auto_config"] = True
+    test_service.config_manager.save()
+
+    detector = json.loads(test_service.status())["configs"]["detectors"]["TestDetector"]
+    assert detector["auto_config"] is True
+
+
+def test_config_manager_load_skips_unchanged_file(temp_config_file):
+    """load() keeps the loaded configs while the file is unchanged and
+    re-reads it once it changes."""
+    manager = ConfigManager(str(temp_config_file), CoreDetectorConfig, Mock())
+    first = manager.get()
+
+    manager.load()
+    assert manager.get() is first
+
+    data = yaml.safe_load(temp_config_file.read_text())
+    data["detectors"]["TestDetector"]["auto_config"] = True
+    temp_config_file.write_text(yaml.dump(data, sort_keys=False))
+    manager.load()
+    assert manager.get() is not first
+    assert manager.get().detectors["TestDetector"]["auto_config"] is True
+
+
+def test_config_manager_loads_json_config(temp_config_file):
+    """A config file written as JSON (which is also YAML) loads as usual."""
+    data = json.loads(json.dumps(yaml.safe_load(temp_config_file.read_text())))
+    temp_config_file.write_text(json.dumps(data, indent=2))
+
+    manager = ConfigManager(str(temp_config_file), CoreDetectorConfig, Mock())
+    assert manager.get().detectors == data["detectors"]
+
+
+def test_config_manager_save_replaces_file_atomically(temp_config_file):
+    """save() swaps in a fully written file and keeps its permissions."""
+    temp_config_file.chmod(0o640)
+    manager = ConfigManager(str(temp_config_file), CoreDetectorConfig, Mock())
+
+    manager.save({"detectors": {"Other": {"method_type": "x"}}})
+
+    assert yaml.safe_load(temp_config_file.read_text()) == {"detectors": {"Other": {"method_type": "x"}}}
+    assert (temp_config_file.stat().st_mode & 0o777) == 0o640
+    assert not temp_config_file.with_name(temp_config_file.name + ".tmp").exists()
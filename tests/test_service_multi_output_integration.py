@@ -183,6 +183,26 @@ class TestServiceMultiOutputIntegration:
         # Verify output addresses are in settings
         assert status_data['settings']['out_addr'] == out_addrs
 
+    def test_service_status_with_date_config_value(self, tmp_path, ipc_paths, http_port, service_factory):
+        """Test that status encodes config values JSON has no type for."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("detectors:\n  TestDetector:\n    since: 2024-01-01\n")
+        settings = create_settings(ipc_paths, port=http_port, config_file=config_file)
+        service_factory(settings)
+
+        # loading the config makes start-up slower than STARTUP_DELAY
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                response = httpx.get(f"{BASE_HTTP_URL}:{http_port}/admin/status")
+                break
+            except httpx.ConnectError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.1)
+        assert response.status_code == 200
+        assert response.json()['configs']['detectors'] == {'TestDetector': {'since': '2024-01-01'}}
+
     def test_service_context_manager_with_outputs(
             self,
             ipc_paths,
@@ -115,3 +115,28 @@ def test_service_id_stability():
     )
 
     assert settings1.component_id != settings3.component_id
+
+
+def test_service_runs_without_http(tmp_path):
+    """With http_enabled=False, run() processes messages without starting
+    the admin server."""
+    settings = ServiceSettings(
+        engine_addr=f"ipc://{tmp_path}/no_http_engine.ipc",
+        engine_autostart=True,
+        http_enabled=False,
+        log_level="ERROR",
+    )
+    service = SmokeTestService(settings=settings)
+    thread = threading.Thread(target=service.run, daemon=True)
+    thread.start()
+    time.sleep(0.2)
+    try:
+        assert service.web_server is None
+        with pynng.Pair0(dial=settings.engine_addr) as pair:
+            pair.recv_timeout = 1000
+            pair.send(b"ping")
+            assert pair.recv() == b"processed: ping"
+    finally:
+        service._service_exit_event.set()
+        thread.join(timeout=2.0)
+    assert not thread.is_alive()